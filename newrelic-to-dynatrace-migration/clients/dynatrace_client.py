@@ -5,20 +5,122 @@ Provides methods to import configuration entities to Dynatrace
 using the Settings API v2 and Configuration API.
 """
 
-import json
+import asyncio
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from urllib.parse import urlencode
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson as _json  # ~3x faster decode, ~6-10x faster encode
+except ImportError:
+    import json as _json
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 import structlog
 
 logger = structlog.get_logger()
 
+# How long near-static lookups (schemas, synthetic locations) stay cached
+_CACHE_TTL_SECONDS = 300
+
+# Retry policy shared by every transport
+_RETRY = Retry(
+    total=3,
+    backoff_factor=1,
+    backoff_jitter=1.0,
+    status_forcelist=[429, 500, 502, 503, 504],
+    # urllib3 only retries idempotent verbs by default, which excludes
+    # the POSTs every import goes through — list them explicitly so a
+    # 429 actually backs off instead of surfacing immediately.
+    allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+    respect_retry_after_header=True
+)
+
+# One adapter (and thus one urllib3 pool) shared by all clients, so
+# per-tenant client instances reuse warm connections; auth stays on the
+# per-instance session headers.
+_SHARED_ADAPTER: Optional[HTTPAdapter] = None
+_SHARED_ADAPTER_LOCK = threading.Lock()
+
+
+def _shared_adapter() -> HTTPAdapter:
+    """Get the process-wide HTTPAdapter, creating it on first use."""
+    global _SHARED_ADAPTER
+    with _SHARED_ADAPTER_LOCK:
+        if _SHARED_ADAPTER is None:
+            _SHARED_ADAPTER = HTTPAdapter(
+                max_retries=_RETRY,
+                pool_connections=32,
+                pool_maxsize=64,
+                pool_block=False
+            )
+        return _SHARED_ADAPTER
+
+# Notification integration type -> Settings API v2 schema ID
+_NOTIFICATION_SCHEMAS = {
+    "email": "builtin:problem.notifications.email",
+    "slack": "builtin:problem.notifications.slack",
+    "pagerduty": "builtin:problem.notifications.pager-duty",
+    "webhook": "builtin:problem.notifications.webhook",
+    "jira": "builtin:problem.notifications.jira",
+    "servicenow": "builtin:problem.notifications.service-now",
+    "opsgenie": "builtin:problem.notifications.ops-genie",
+    "victorops": "builtin:problem.notifications.victor-ops",
+}
+
+
+class _TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
 
-@dataclass
+    Refills continuously at `rate` tokens/second up to `capacity`, so
+    short bursts are absorbed without sleeping while the long-run rate
+    stays bounded. acquire() blocks only when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, n: float = 1.0):
+        """Block until n tokens are available, then consume them."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_refill) * self.rate
+                )
+                self.last_refill = now
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                wait = (n - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+@dataclass(slots=True, frozen=True)
 class DynatraceResponse:
     """Response wrapper for Dynatrace API calls."""
     data: Optional[Any]
@@ -30,7 +132,7 @@ class DynatraceResponse:
         return 200 <= self.status_code < 300
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImportResult:
     """Result of an import operation."""
     entity_type: str
@@ -57,39 +159,79 @@ class DynatraceClient:
         self,
         api_token: str,
         environment_url: str,
-        rate_limit: float = 5.0
+        rate_limit: float = 5.0,
+        transport: str = "requests"
     ):
         self.api_token = api_token
         self.environment_url = environment_url.rstrip("/")
         self.rate_limit = rate_limit
-        self._last_request_time = 0.0
+        self.transport = transport
+        self._rate_limiter = _TokenBucket(rate=rate_limit)
+        self._ttl_cache: Dict[str, Tuple[float, Any]] = {}
 
         # API endpoints
         self.api_v2 = f"{self.environment_url}/api/v2"
         self.config_api = f"{self.environment_url}/api/config/v1"
 
-        # Configure session with retries
+        # Precompute hot-path URLs once instead of per call
+        self._settings_schemas_url = f"{self.api_v2}/settings/schemas"
+        self._settings_objects_url = f"{self.api_v2}/settings/objects"
+        self._dashboards_url = f"{self.config_api}/dashboards"
+        self._slo_url = f"{self.api_v2}/slo"
+        self._synthetic_monitors_url = f"{self.environment_url}/api/v1/synthetic/monitors"
+        self._synthetic_locations_url = f"{self.environment_url}/api/v1/synthetic/locations"
+
+        # Configure session with the shared retrying adapter; the large
+        # warm pool means backup/import bursts reuse keep-alive
+        # connections instead of paying a TLS handshake per request.
         self.session = requests.Session()
-        retries = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retries)
+        adapter = _shared_adapter()
         self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "Content-Type": "application/json",
-            "Authorization": f"Api-Token {self.api_token}"
+            "Authorization": f"Api-Token {self.api_token}",
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate"
         })
 
+        # Optional httpx transport: HTTP/2 multiplexes many in-flight
+        # requests over one connection, so a single socket can saturate
+        # the rate limit without a large HTTP/1.1 pool.
+        self._httpx_client = None
+        if transport == "httpx":
+            if httpx is None:
+                raise ImportError(
+                    "httpx is required for transport='httpx' "
+                    "(pip install httpx[http2])"
+                )
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+            self._httpx_client = httpx.Client(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=8,
+                    max_keepalive_connections=8
+                ),
+                timeout=60,
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Api-Token {self.api_token}"
+                }
+            )
+        # Raw urllib3 transport skips requests' per-call PreparedRequest,
+        # hook, and cookie machinery (none of which this client uses);
+        # the pool is built lazily on first request.
+        self._pool = None
+        if transport not in ("requests", "httpx", "urllib3"):
+            raise ValueError(f"Unknown transport: {transport}")
+
     def _rate_limit_wait(self):
         """Implement rate limiting between requests."""
-        if self.rate_limit > 0:
-            elapsed = time.time() - self._last_request_time
-            min_interval = 1.0 / self.rate_limit
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-        self._last_request_time = time.time()
+        self._rate_limiter.acquire()
 
     def _request(
         self,
@@ -101,36 +243,137 @@ class DynatraceClient:
         """Make an API request to Dynatrace."""
         self._rate_limit_wait()
 
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                timeout=60
-            )
+        if self.transport == "urllib3":
+            return self._request_urllib3(method, url, data=data, params=params)
 
-            response_data = None
-            if response.content:
-                try:
-                    response_data = response.json()
-                except json.JSONDecodeError:
-                    response_data = response.text
+        errors = (requests.exceptions.RequestException,)
+        if httpx is not None:
+            errors += (httpx.HTTPError,)
+
+        try:
+            # Pre-serialize the payload (orjson emits bytes) instead of
+            # passing json=data, so requests doesn't re-encode with stdlib json.
+            body = _json.dumps(data) if data is not None else None
+            if self._httpx_client is not None:
+                response = self._httpx_client.request(
+                    method=method,
+                    url=url,
+                    content=body,
+                    params=params
+                )
+                reason = response.reason_phrase
+            else:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    data=body,
+                    params=params,
+                    timeout=60
+                )
+                reason = response.reason
 
             if response.status_code >= 400:
-                error_msg = str(response_data) if response_data else response.reason
+                # Only look at the first 4 KiB of an error body; retry
+                # storms against proxies can return multi-MB HTML pages.
+                snippet = response.content[:4096]
+                response_data = None
+                if snippet:
+                    try:
+                        response_data = _json.loads(snippet)
+                    except _json.JSONDecodeError:
+                        response_data = snippet.decode("utf-8", errors="replace")
+                error_msg = (str(response_data) if response_data else reason)[:512]
                 return DynatraceResponse(
                     data=response_data,
                     status_code=response.status_code,
                     error=error_msg
                 )
 
+            response_data = None
+            # DELETEs and 204 No Content carry no useful payload; skip
+            # the body materialization and parse pass entirely.
+            if method != "DELETE" and response.status_code != 204 and response.content:
+                try:
+                    # orjson accepts bytes directly, skipping the UTF-8
+                    # decode-to-str pass that response.json() performs.
+                    response_data = _json.loads(response.content)
+                except _json.JSONDecodeError:
+                    # Decode directly instead of response.text, which runs
+                    # charset detection over the whole body.
+                    response_data = response.content.decode("utf-8", errors="replace")
+
             return DynatraceResponse(
                 data=response_data,
                 status_code=response.status_code
             )
 
-        except requests.exceptions.RequestException as e:
+        except errors as e:
+            logger.error("Dynatrace API error", error=str(e))
+            return DynatraceResponse(
+                data=None,
+                status_code=0,
+                error=str(e)
+            )
+
+    def _request_urllib3(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None
+    ) -> DynatraceResponse:
+        """Hot-path request via a raw urllib3 pool (transport='urllib3')."""
+        import urllib3
+
+        if self._pool is None:
+            self._pool = urllib3.PoolManager(
+                num_pools=4,
+                maxsize=64,
+                retries=_RETRY,
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Api-Token {self.api_token}",
+                    "Accept-Encoding": "gzip, deflate"
+                },
+                timeout=urllib3.Timeout(total=60)
+            )
+
+        if params:
+            url = f"{url}?{urlencode(params)}"
+
+        try:
+            body = _json.dumps(data) if data is not None else None
+            response = self._pool.request(method, url, body=body)
+            content = response.data
+
+            if response.status >= 400:
+                snippet = content[:4096]
+                response_data = None
+                if snippet:
+                    try:
+                        response_data = _json.loads(snippet)
+                    except _json.JSONDecodeError:
+                        response_data = snippet.decode("utf-8", errors="replace")
+                error_msg = (str(response_data) if response_data else response.reason)[:512]
+                return DynatraceResponse(
+                    data=response_data,
+                    status_code=response.status,
+                    error=error_msg
+                )
+
+            response_data = None
+            if method != "DELETE" and response.status != 204 and content:
+                try:
+                    response_data = _json.loads(content)
+                except _json.JSONDecodeError:
+                    response_data = content.decode("utf-8", errors="replace")
+
+            return DynatraceResponse(
+                data=response_data,
+                status_code=response.status
+            )
+
+        except urllib3.exceptions.HTTPError as e:
             logger.error("Dynatrace API error", error=str(e))
             return DynatraceResponse(
                 data=None,
@@ -142,6 +385,106 @@ class DynatraceClient:
         """HTTP GET request."""
         return self._request("GET", url, params=params)
 
+    def _iter_paged(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        items_key: str = "items"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate items across nextPageKey-paginated responses, prefetching
+        page N+1 in a background thread while page N is being consumed so
+        caller processing overlaps with network latency.
+        """
+        params = dict(params) if params else {}
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.get, url, dict(params))
+
+            while True:
+                response = future.result()
+                future = None
+
+                if not response.is_success:
+                    break
+
+                next_page_key = response.data.get("nextPageKey")
+                if next_page_key:
+                    next_params = dict(params)
+                    next_params["nextPageKey"] = next_page_key
+                    future = executor.submit(self.get, url, next_params)
+
+                yield from response.data.get(items_key, [])
+
+                if future is None:
+                    break
+
+    def _iter_paged_streaming(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        items_key: str = "items"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate items across paginated responses, parsing each page
+        incrementally with ijson so memory stays bounded to one item
+        instead of the full multi-MB page. Falls back to _iter_paged
+        when ijson is not installed.
+        """
+        if ijson is None:
+            yield from self._iter_paged(url, params=params, items_key=items_key)
+            return
+
+        params = dict(params) if params else {}
+
+        while True:
+            self._rate_limit_wait()
+            try:
+                response = self.session.request(
+                    "GET", url, params=params, timeout=60, stream=True
+                )
+            except requests.exceptions.RequestException as e:
+                logger.error("Dynatrace API error", error=str(e))
+                return
+
+            try:
+                if response.status_code >= 400:
+                    return
+                response.raw.decode_content = True
+                next_page_key = yield from self._stream_page(
+                    response.raw, items_key
+                )
+            finally:
+                response.close()
+
+            if not next_page_key:
+                return
+            params["nextPageKey"] = next_page_key
+
+    @staticmethod
+    def _stream_page(raw, items_key: str):
+        """
+        Yield items from one response body as they are parsed; returns
+        the page's nextPageKey (if any) as the generator's return value.
+        """
+        item_prefix = f"{items_key}.item"
+        child_prefix = f"{item_prefix}."
+        next_page_key = None
+        builder = None
+
+        for prefix, event, value in ijson.parse(raw):
+            if prefix == "nextPageKey" and event == "string":
+                next_page_key = value
+            elif prefix == item_prefix or prefix.startswith(child_prefix):
+                if builder is None:
+                    builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                if prefix == item_prefix and event == "end_map":
+                    yield builder.value
+                    builder = None
+
+        return next_page_key
+
     def post(self, url: str, data: Dict) -> DynatraceResponse:
         """HTTP POST request."""
         return self._request("POST", url, data=data)
@@ -154,50 +497,70 @@ class DynatraceClient:
         """HTTP DELETE request."""
         return self._request("DELETE", url)
 
+    def _cached(self, key: str, fetch) -> Any:
+        """Return a TTL-cached value, calling fetch() on miss or expiry."""
+        entry = self._ttl_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < _CACHE_TTL_SECONDS:
+            return entry[1]
+        value = fetch()
+        self._ttl_cache[key] = (now, value)
+        return value
+
     # =========================================================================
     # Settings API v2 Methods
     # =========================================================================
 
     def get_settings_schemas(self) -> List[Dict[str, Any]]:
-        """Get all available settings schemas."""
-        url = f"{self.api_v2}/settings/schemas"
-        response = self.get(url)
+        """Get all available settings schemas (cached for a few minutes)."""
+        def fetch():
+            response = self.get(self._settings_schemas_url)
+            if response.is_success:
+                return response.data.get("items", [])
+            return []
 
-        if response.is_success:
-            return response.data.get("items", [])
-        return []
+        return self._cached("settings_schemas", fetch)
 
-    def get_settings_objects(
+    def _iter_settings_objects(
         self,
         schema_id: str,
         scope: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Get settings objects for a schema."""
-        url = f"{self.api_v2}/settings/objects"
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate settings objects for a schema, prefetching pages."""
+        url = self._settings_objects_url
         params = {"schemaIds": schema_id}
         if scope:
             params["scopes"] = scope
+        yield from self._iter_paged_streaming(url, params=params, items_key="items")
 
-        all_objects = []
-        next_page_key = None
-
-        while True:
-            if next_page_key:
-                params["nextPageKey"] = next_page_key
-
-            response = self.get(url, params=params)
-
-            if not response.is_success:
-                break
-
-            items = response.data.get("items", [])
-            all_objects.extend(items)
-
-            next_page_key = response.data.get("nextPageKey")
-            if not next_page_key:
-                break
+    def get_settings_objects(
+        self,
+        schema_id: str,
+        scope: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get settings objects for a schema."""
+        return list(self._iter_settings_objects(schema_id, scope=scope))
 
-        return all_objects
+    def create_settings_objects_batch(
+        self,
+        items: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> DynatraceResponse:
+        """
+        Create multiple settings objects with a single POST.
+
+        The Settings API v2 accepts a list of objects and responds with a
+        parallel array of per-item results, so batching collapses N
+        round-trips (each paying rate-limit spacing) into one.
+
+        Args:
+            items: List of (schema_id, scope, value) tuples.
+        """
+        url = self._settings_objects_url
+        payload = [
+            {"schemaId": schema_id, "scope": scope, "value": value}
+            for schema_id, scope, value in items
+        ]
+        return self.post(url, payload)
 
     def create_settings_object(
         self,
@@ -206,14 +569,90 @@ class DynatraceClient:
         scope: str = "environment"
     ) -> DynatraceResponse:
         """Create a settings object."""
-        url = f"{self.api_v2}/settings/objects"
-        payload = [{
-            "schemaId": schema_id,
-            "scope": scope,
-            "value": value
-        }]
+        return self.create_settings_objects_batch([(schema_id, scope, value)])
 
-        return self.post(url, payload)
+    def create_many_settings_objects(
+        self,
+        schema_id: str,
+        entity_type: str,
+        values: List[Dict[str, Any]],
+        batch_size: int = 100,
+        name_key: str = "name"
+    ) -> List[ImportResult]:
+        """Create settings objects of one schema in batched POSTs.
+
+        The Settings API accepts up to 100 objects per request and
+        answers with a parallel per-item result array, so the per-entity
+        round-trip (and its rate-limit spacing) is amortized across the
+        batch.
+        """
+        results = []
+
+        for start in range(0, len(values), batch_size):
+            batch = values[start:start + batch_size]
+            response = self.create_settings_objects_batch(
+                [(schema_id, "environment", value) for value in batch]
+            )
+
+            # The API returns one result per submitted object, in
+            # order. A 200/207 batch can still carry per-item failures,
+            # so an item only counts as created when its entry holds an
+            # objectId (or an explicit 2xx code).
+            created_items = response.data if response.is_success else []
+            for i, value in enumerate(batch):
+                created = created_items[i] if i < len(created_items) else None
+                object_id = created.get("objectId") if created else None
+                item_code = created.get("code") if created else None
+                item_ok = response.is_success and (
+                    object_id is not None
+                    or (item_code is not None and 200 <= item_code < 300)
+                )
+
+                if item_ok:
+                    error_message = None
+                elif not response.is_success:
+                    error_message = response.error
+                else:
+                    error_message = self._settings_item_error(created)
+
+                results.append(ImportResult(
+                    entity_type=entity_type,
+                    entity_name=value.get(name_key, "Unknown"),
+                    success=item_ok,
+                    dynatrace_id=object_id,
+                    error_message=error_message
+                ))
+
+        return results
+
+    @staticmethod
+    def _settings_item_error(item: Optional[Dict[str, Any]]) -> str:
+        """Extract the error message from a per-item batch result."""
+        if item is None:
+            return "No result returned for item"
+        error = item.get("error")
+        if isinstance(error, dict):
+            return error.get("message") or str(error)
+        if error:
+            return str(error)
+        code = item.get("code")
+        if code is not None:
+            return f"Item rejected with code {code}"
+        return "Item result contained no objectId"
+
+    def create_many_metric_events(
+        self,
+        metric_events: List[Dict[str, Any]],
+        batch_size: int = 50
+    ) -> List[ImportResult]:
+        """Create metric events in batches of batch_size per request."""
+        return self.create_many_settings_objects(
+            "builtin:anomaly-detection.metric-events",
+            "metric_event",
+            metric_events,
+            batch_size=batch_size,
+            name_key="summary"
+        )
 
     def update_settings_object(
         self,
@@ -230,7 +669,7 @@ class DynatraceClient:
 
     def create_dashboard(self, dashboard: Dict[str, Any]) -> ImportResult:
         """Create a dashboard in Dynatrace."""
-        url = f"{self.config_api}/dashboards"
+        url = self._dashboards_url
         response = self.post(url, dashboard)
 
         if response.is_success:
@@ -251,18 +690,22 @@ class DynatraceClient:
 
     def get_all_dashboards(self) -> List[Dict[str, Any]]:
         """Get all dashboards for backup purposes."""
-        url = f"{self.config_api}/dashboards"
+        url = self._dashboards_url
         response = self.get(url)
 
         if response.is_success:
-            dashboards = []
-            for item in response.data.get("dashboards", []):
-                # Get full dashboard definition
-                full_url = f"{self.config_api}/dashboards/{item['id']}"
-                full_response = self.get(full_url)
-                if full_response.is_success:
-                    dashboards.append(full_response.data)
-            return dashboards
+            items = response.data.get("dashboards", [])
+
+            # Fetch full definitions in parallel; requests release the GIL
+            # during I/O so this is bounded by the rate limit, not latency.
+            def fetch(item: Dict[str, Any]) -> DynatraceResponse:
+                return self.get(f"{self._dashboards_url}/{item['id']}")
+
+            max_workers = max(1, min(16, int(self.rate_limit * 2) or 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(fetch, items))
+
+            return [r.data for r in responses if r.is_success]
         return []
 
     # =========================================================================
@@ -328,7 +771,7 @@ class DynatraceClient:
 
     def create_http_monitor(self, monitor: Dict[str, Any]) -> ImportResult:
         """Create an HTTP synthetic monitor."""
-        url = f"{self.environment_url}/api/v1/synthetic/monitors"
+        url = self._synthetic_monitors_url
         response = self.post(url, monitor)
 
         if response.is_success:
@@ -348,7 +791,7 @@ class DynatraceClient:
 
     def create_browser_monitor(self, monitor: Dict[str, Any]) -> ImportResult:
         """Create a browser synthetic monitor."""
-        url = f"{self.environment_url}/api/v1/synthetic/monitors"
+        url = self._synthetic_monitors_url
         response = self.post(url, monitor)
 
         if response.is_success:
@@ -367,13 +810,14 @@ class DynatraceClient:
             )
 
     def get_synthetic_locations(self) -> List[Dict[str, Any]]:
-        """Get available synthetic monitoring locations."""
-        url = f"{self.environment_url}/api/v1/synthetic/locations"
-        response = self.get(url)
+        """Get available synthetic monitoring locations (cached)."""
+        def fetch():
+            response = self.get(self._synthetic_locations_url)
+            if response.is_success:
+                return response.data.get("locations", [])
+            return []
 
-        if response.is_success:
-            return response.data.get("locations", [])
-        return []
+        return self._cached("synthetic_locations", fetch)
 
     # =========================================================================
     # SLO Methods
@@ -381,7 +825,7 @@ class DynatraceClient:
 
     def create_slo(self, slo: Dict[str, Any]) -> ImportResult:
         """Create an SLO in Dynatrace."""
-        url = f"{self.api_v2}/slo"
+        url = self._slo_url
         response = self.post(url, slo)
 
         if response.is_success:
@@ -399,30 +843,14 @@ class DynatraceClient:
                 error_message=response.error
             )
 
+    def _iter_slos(self) -> Iterator[Dict[str, Any]]:
+        """Iterate all SLOs, prefetching pages."""
+        url = self._slo_url
+        yield from self._iter_paged(url, items_key="slo")
+
     def get_all_slos(self) -> List[Dict[str, Any]]:
         """Get all SLOs for backup purposes."""
-        url = f"{self.api_v2}/slo"
-        all_slos = []
-        next_page_key = None
-
-        while True:
-            params = {}
-            if next_page_key:
-                params["nextPageKey"] = next_page_key
-
-            response = self.get(url, params=params)
-
-            if not response.is_success:
-                break
-
-            slos = response.data.get("slo", [])
-            all_slos.extend(slos)
-
-            next_page_key = response.data.get("nextPageKey")
-            if not next_page_key:
-                break
-
-        return all_slos
+        return list(self._iter_slos())
 
     # =========================================================================
     # Management Zone Methods
@@ -464,19 +892,7 @@ class DynatraceClient:
         config: Dict[str, Any]
     ) -> ImportResult:
         """Create a notification integration."""
-        # Map integration types to schema IDs
-        schema_map = {
-            "email": "builtin:problem.notifications.email",
-            "slack": "builtin:problem.notifications.slack",
-            "pagerduty": "builtin:problem.notifications.pager-duty",
-            "webhook": "builtin:problem.notifications.webhook",
-            "jira": "builtin:problem.notifications.jira",
-            "servicenow": "builtin:problem.notifications.service-now",
-            "opsgenie": "builtin:problem.notifications.ops-genie",
-            "victorops": "builtin:problem.notifications.victor-ops",
-        }
-
-        schema_id = schema_map.get(integration_type.lower())
+        schema_id = _NOTIFICATION_SCHEMAS.get(integration_type.lower())
         if not schema_id:
             return ImportResult(
                 entity_type="notification",
@@ -513,7 +929,7 @@ class DynatraceClient:
 
     def validate_connection(self) -> bool:
         """Validate API token and connectivity."""
-        url = f"{self.api_v2}/settings/schemas"
+        url = self._settings_schemas_url
         response = self.get(url, params={"pageSize": 1})
         return response.is_success
 
@@ -524,16 +940,255 @@ class DynatraceClient:
         backup_data = {
             "metadata": {
                 "environment_url": self.environment_url,
-                "backup_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "backup_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
                 "tool_version": "1.0.0"
-            },
-            "dashboards": self.get_all_dashboards(),
-            "slos": self.get_all_slos(),
-            "alerting_profiles": self.get_settings_objects("builtin:alerting.profile"),
-            "metric_events": self.get_settings_objects("builtin:anomaly-detection.metric-events"),
-            "management_zones": self.get_settings_objects("builtin:management-zones"),
+            }
+        }
+
+        # The five sections share no data dependencies, so run them in
+        # parallel; the token bucket keeps the combined request rate bounded.
+        tasks = {
+            "dashboards": self.get_all_dashboards,
+            "slos": self.get_all_slos,
+            "alerting_profiles": lambda: self.get_settings_objects("builtin:alerting.profile"),
+            "metric_events": lambda: self.get_settings_objects("builtin:anomaly-detection.metric-events"),
+            "management_zones": lambda: self.get_settings_objects("builtin:management-zones"),
         }
 
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {name: executor.submit(task) for name, task in tasks.items()}
+            for name, future in futures.items():
+                backup_data[name] = future.result()
+
+        logger.info(
+            "Backup complete",
+            dashboards=len(backup_data["dashboards"]),
+            slos=len(backup_data["slos"])
+        )
+
+        return backup_data
+
+
+class _AsyncTokenBucket:
+    """asyncio variant of _TokenBucket; sleeps on the event loop."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, n: float = 1.0):
+        """Wait until n tokens are available, then consume them."""
+        if self.rate <= 0:
+            return
+        while True:
+            async with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_refill) * self.rate
+                )
+                self.last_refill = now
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                wait = (n - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+
+
+class AsyncDynatraceClient:
+    """
+    Async variant of DynatraceClient built on httpx.
+
+    All requests share one event loop and a small multiplexed connection
+    pool (HTTP/2 when the h2 package is installed), which scales the
+    backup/import fan-out paths well past what a thread pool can do.
+    Requires the optional httpx dependency.
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        environment_url: str,
+        rate_limit: float = 5.0
+    ):
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for AsyncDynatraceClient "
+                "(pip install httpx)"
+            )
+
+        self.api_token = api_token
+        self.environment_url = environment_url.rstrip("/")
+        self.rate_limit = rate_limit
+        self._rate_limiter = _AsyncTokenBucket(rate=rate_limit)
+
+        # API endpoints
+        self.api_v2 = f"{self.environment_url}/api/v2"
+        self.config_api = f"{self.environment_url}/api/config/v1"
+
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=60,
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Api-Token {self.api_token}"
+            }
+        )
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncDynatraceClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _arequest(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Any] = None,
+        params: Optional[Dict] = None
+    ) -> DynatraceResponse:
+        """Make an API request to Dynatrace."""
+        await self._rate_limiter.acquire()
+
+        try:
+            body = _json.dumps(data) if data is not None else None
+            response = await self._client.request(
+                method=method,
+                url=url,
+                content=body,
+                params=params
+            )
+
+            response_data = None
+            if response.content:
+                try:
+                    response_data = _json.loads(response.content)
+                except _json.JSONDecodeError:
+                    response_data = response.content.decode("utf-8", errors="replace")
+
+            if response.status_code >= 400:
+                error_msg = str(response_data) if response_data else response.reason_phrase
+                return DynatraceResponse(
+                    data=response_data,
+                    status_code=response.status_code,
+                    error=error_msg
+                )
+
+            return DynatraceResponse(
+                data=response_data,
+                status_code=response.status_code
+            )
+
+        except httpx.HTTPError as e:
+            logger.error("Dynatrace API error", error=str(e))
+            return DynatraceResponse(
+                data=None,
+                status_code=0,
+                error=str(e)
+            )
+
+    async def get(self, url: str, params: Optional[Dict] = None) -> DynatraceResponse:
+        """HTTP GET request."""
+        return await self._arequest("GET", url, params=params)
+
+    async def post(self, url: str, data: Any) -> DynatraceResponse:
+        """HTTP POST request."""
+        return await self._arequest("POST", url, data=data)
+
+    async def _paged_items(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        items_key: str = "items"
+    ) -> List[Dict[str, Any]]:
+        """Collect items across nextPageKey-paginated responses."""
+        params = dict(params) if params else {}
+        items = []
+
+        while True:
+            response = await self.get(url, params=params)
+            if not response.is_success:
+                break
+
+            items.extend(response.data.get(items_key, []))
+
+            next_page_key = response.data.get("nextPageKey")
+            if not next_page_key:
+                break
+            params["nextPageKey"] = next_page_key
+
+        return items
+
+    async def get_settings_objects(
+        self,
+        schema_id: str,
+        scope: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get settings objects for a schema."""
+        url = f"{self.api_v2}/settings/objects"
+        params = {"schemaIds": schema_id}
+        if scope:
+            params["scopes"] = scope
+        return await self._paged_items(url, params=params, items_key="items")
+
+    async def get_all_slos(self) -> List[Dict[str, Any]]:
+        """Get all SLOs for backup purposes."""
+        url = f"{self.api_v2}/slo"
+        return await self._paged_items(url, items_key="slo")
+
+    async def get_all_dashboards(self) -> List[Dict[str, Any]]:
+        """Get all dashboards, fetching full definitions concurrently."""
+        url = f"{self.config_api}/dashboards"
+        response = await self.get(url)
+
+        if not response.is_success:
+            return []
+
+        items = response.data.get("dashboards", [])
+        responses = await asyncio.gather(*(
+            self.get(f"{self.config_api}/dashboards/{item['id']}")
+            for item in items
+        ))
+        return [r.data for r in responses if r.is_success]
+
+    async def backup_all(self) -> Dict[str, Any]:
+        """Backup all supported configurations from Dynatrace."""
+        logger.info("Starting Dynatrace backup")
+
+        backup_data = {
+            "metadata": {
+                "environment_url": self.environment_url,
+                "backup_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "tool_version": "1.0.0"
+            }
+        }
+
+        sections = (
+            ("dashboards", self.get_all_dashboards()),
+            ("slos", self.get_all_slos()),
+            ("alerting_profiles", self.get_settings_objects("builtin:alerting.profile")),
+            ("metric_events", self.get_settings_objects("builtin:anomaly-detection.metric-events")),
+            ("management_zones", self.get_settings_objects("builtin:management-zones")),
+        )
+        results = await asyncio.gather(*(coro for _, coro in sections))
+        for (name, _), result in zip(sections, results):
+            backup_data[name] = result
+
         logger.info(
             "Backup complete",
             dashboards=len(backup_data["dashboards"]),
@@ -5,28 +5,626 @@ Provides methods to export all configuration entities from New Relic
 using the NerdGraph GraphQL API.
 """
 
-import json
+import gzip
+import os
+import random
+import threading
+from collections import defaultdict
+from functools import lru_cache
 import time
-from typing import Any, Dict, List, Optional, Generator
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Generator, Tuple
 from dataclasses import dataclass
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson as _json  # ~2-3x faster decode on large NerdGraph payloads
+except ImportError:
+    import json as _json
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson  # incremental parsing for very large responses
+except ImportError:
+    ijson = None
+
+try:
+    import diskcache  # optional on-disk cache for repeat exports
+except ImportError:
+    diskcache = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 import structlog
 
 logger = structlog.get_logger()
 
 
-@dataclass
+# NerdGraph accepts up to ~25 guids per entities() call before response
+# sizes and timeouts become a problem.
+_GUID_BATCH_SIZE = 25
+
+# Entity definitions rarely change between iterative migration test
+# runs; cached copies expire after an hour.
+_ENTITY_CACHE_TTL_SECONDS = 3600
+
+# Outbound payloads below this size are not worth a gzip pass; only the
+# multi-guid batch queries tend to exceed it.
+_GZIP_MIN_BYTES = 4096
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize to bytes with orjson, or stdlib json when falling back."""
+    encoded = _json.dumps(obj)
+    return encoded if isinstance(encoded, bytes) else encoded.encode("utf-8")
+
+
+def _chunked(items: List[Any], size: int) -> Generator[List[Any], None, None]:
+    """Yield successive fixed-size chunks from a list."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+@lru_cache(maxsize=64)
+def _compile_path(path: Tuple[str, ...]) -> Callable[[Optional[Dict[str, Any]]], Any]:
+    """Build a reusable accessor for a navigation path.
+
+    The closure binds the keys once, so per-page navigation skips the
+    tuple iteration setup; compiled accessors are cached since the set
+    of paths is small and fixed.
+    """
+    def getter(data: Optional[Dict[str, Any]]) -> Any:
+        node = data
+        for key in path:
+            if node is None:
+                return None
+            node = node.get(key)
+        return node
+
+    return getter
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) to seconds."""
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# GraphQL documents are constant; binding them once at import time
+# avoids re-creating large string locals on every call.
+_DASHBOARDS_LIST_QUERY = """
+    query($accountId: Int!, $cursor: String) {
+        actor {
+            entitySearch(
+                query: "accountId = $accountId AND type = 'DASHBOARD'"
+                options: { limit: 200 }
+            ) {
+                results(cursor: $cursor) {
+                    entities {
+                        guid
+                        name
+                        ... on DashboardEntityOutline {
+                            dashboardParentGuid
+                        }
+                    }
+                    nextCursor
+                }
+            }
+        }
+    }
+    """
+
+_DASHBOARD_DEFINITION_QUERY = """
+    query($guid: EntityGuid!) {
+        actor {
+            entity(guid: $guid) {
+                ... on DashboardEntity {
+                    guid
+                    name
+                    description
+                    permissions
+                    pages {
+                        guid
+                        name
+                        description
+                        widgets {
+                            id
+                            title
+                            layout {
+                                column
+                                row
+                                width
+                                height
+                            }
+                            visualization {
+                                id
+                            }
+                            rawConfiguration
+                        }
+                    }
+                    variables {
+                        name
+                        type
+                        defaultValues
+                        isMultiSelection
+                        items {
+                            title
+                            value
+                        }
+                        nrqlQuery {
+                            accountIds
+                            query
+                        }
+                        replacementStrategy
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_DASHBOARD_BATCH_QUERY = """
+    query($guids: [EntityGuid]!) {
+        actor {
+            entities(guids: $guids) {
+                ... on DashboardEntity {
+                    guid
+                    name
+                    description
+                    permissions
+                    pages {
+                        guid
+                        name
+                        description
+                        widgets {
+                            id
+                            title
+                            layout {
+                                column
+                                row
+                                width
+                                height
+                            }
+                            visualization {
+                                id
+                            }
+                            rawConfiguration
+                        }
+                    }
+                    variables {
+                        name
+                        type
+                        defaultValues
+                        isMultiSelection
+                        items {
+                            title
+                            value
+                        }
+                        nrqlQuery {
+                            accountIds
+                            query
+                        }
+                        replacementStrategy
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_ALERT_POLICIES_QUERY = """
+    query($accountId: Int!, $cursor: String) {
+        actor {
+            account(id: $accountId) {
+                alerts {
+                    policiesSearch(cursor: $cursor) {
+                        policies {
+                            id
+                            name
+                            incidentPreference
+                        }
+                        nextCursor
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_NRQL_CONDITIONS_QUERY = """
+    query($accountId: Int!, $policyId: ID!, $cursor: String) {
+        actor {
+            account(id: $accountId) {
+                alerts {
+                    nrqlConditionsSearch(
+                        searchCriteria: { policyId: $policyId }
+                        cursor: $cursor
+                    ) {
+                        nrqlConditions {
+                            id
+                            name
+                            type
+                            enabled
+                            nrql {
+                                query
+                            }
+                            signal {
+                                aggregationWindow
+                                aggregationMethod
+                                aggregationDelay
+                                fillOption
+                                fillValue
+                            }
+                            terms {
+                                threshold
+                                thresholdDuration
+                                thresholdOccurrences
+                                operator
+                                priority
+                            }
+                            expiration {
+                                closeViolationsOnExpiration
+                                expirationDuration
+                                openViolationOnExpiration
+                            }
+                            runbookUrl
+                            description
+                        }
+                        nextCursor
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_ALL_NRQL_CONDITIONS_QUERY = """
+    query($accountId: Int!, $cursor: String) {
+        actor {
+            account(id: $accountId) {
+                alerts {
+                    nrqlConditionsSearch(cursor: $cursor) {
+                        nrqlConditions {
+                            id
+                            name
+                            type
+                            enabled
+                            policyId
+                            nrql {
+                                query
+                            }
+                            signal {
+                                aggregationWindow
+                                aggregationMethod
+                                aggregationDelay
+                                fillOption
+                                fillValue
+                            }
+                            terms {
+                                threshold
+                                thresholdDuration
+                                thresholdOccurrences
+                                operator
+                                priority
+                            }
+                            expiration {
+                                closeViolationsOnExpiration
+                                expirationDuration
+                                openViolationOnExpiration
+                            }
+                            runbookUrl
+                            description
+                        }
+                        nextCursor
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_NOTIFICATION_CHANNELS_QUERY = """
+    query($accountId: Int!, $cursor: String) {
+        actor {
+            account(id: $accountId) {
+                aiNotifications {
+                    destinations(cursor: $cursor) {
+                        entities {
+                            id
+                            name
+                            type
+                            active
+                            properties {
+                                key
+                                value
+                            }
+                        }
+                        nextCursor
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_SYNTHETIC_MONITORS_LIST_QUERY = """
+    query($accountId: Int!, $cursor: String) {
+        actor {
+            entitySearch(
+                query: "accountId = $accountId AND type = 'SYNTHETIC_MONITOR'"
+                options: { limit: 200 }
+            ) {
+                results(cursor: $cursor) {
+                    entities {
+                        guid
+                        name
+                        ... on SyntheticMonitorEntityOutline {
+                            monitorType
+                            monitoredUrl
+                            period
+                        }
+                    }
+                    nextCursor
+                }
+            }
+        }
+    }
+    """
+
+_SYNTHETIC_MONITOR_DETAILS_QUERY = """
+    query($guid: EntityGuid!) {
+        actor {
+            entity(guid: $guid) {
+                ... on SyntheticMonitorEntity {
+                    guid
+                    name
+                    monitorType
+                    monitoredUrl
+                    period
+                    status
+                    monitorSummary {
+                        status
+                        successRate
+                    }
+                    tags {
+                        key
+                        values
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_SYNTHETIC_MONITOR_BATCH_QUERY = """
+    query($guids: [EntityGuid]!) {
+        actor {
+            entities(guids: $guids) {
+                ... on SyntheticMonitorEntity {
+                    guid
+                    name
+                    monitorType
+                    monitoredUrl
+                    period
+                    status
+                    monitorSummary {
+                        status
+                        successRate
+                    }
+                    tags {
+                        key
+                        values
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_SYNTHETIC_SCRIPT_QUERY = """
+    query($accountId: Int!, $monitorGuid: EntityGuid!) {
+        actor {
+            account(id: $accountId) {
+                synthetics {
+                    script(monitorGuid: $monitorGuid) {
+                        text
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_SLOS_QUERY = """
+    query($accountId: Int!, $cursor: String) {
+        actor {
+            account(id: $accountId) {
+                serviceLevel {
+                    indicators(cursor: $cursor) {
+                        entities {
+                            guid
+                            name
+                            description
+                            objectives {
+                                target
+                                timeWindow {
+                                    rolling {
+                                        count
+                                        unit
+                                    }
+                                }
+                            }
+                            events {
+                                validEvents {
+                                    from
+                                    where
+                                }
+                                goodEvents {
+                                    from
+                                    where
+                                }
+                                badEvents {
+                                    from
+                                    where
+                                }
+                            }
+                        }
+                        nextCursor
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_WORKLOADS_LIST_QUERY = """
+    query($accountId: Int!, $cursor: String) {
+        actor {
+            entitySearch(
+                query: "accountId = $accountId AND type = 'WORKLOAD'"
+                options: { limit: 200 }
+            ) {
+                results(cursor: $cursor) {
+                    entities {
+                        guid
+                        name
+                        ... on WorkloadEntityOutline {
+                            workloadStatus {
+                                statusValue
+                            }
+                        }
+                    }
+                    nextCursor
+                }
+            }
+        }
+    }
+    """
+
+_WORKLOAD_DETAILS_QUERY = """
+    query($guid: EntityGuid!) {
+        actor {
+            entity(guid: $guid) {
+                ... on WorkloadEntity {
+                    guid
+                    name
+                    collection {
+                        guid
+                        name
+                        type
+                    }
+                    entitySearchQueries {
+                        query
+                    }
+                }
+            }
+        }
+    }
+    """
+
+_WORKLOAD_BATCH_QUERY = """
+    query($guids: [EntityGuid]!) {
+        actor {
+            entities(guids: $guids) {
+                ... on WorkloadEntity {
+                    guid
+                    name
+                    collection {
+                        guid
+                        name
+                        type
+                    }
+                    entitySearchQueries {
+                        query
+                    }
+                }
+            }
+        }
+    }
+    """
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Allows short bursts up to ``capacity`` while maintaining ``rate``
+    requests/second in the long run, so parallel workers are not forced
+    into lock-step 1/rate spacing the way the old sleep-based limiter was.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.initial_rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, float(int(rate)))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available.
+
+        The wait is computed under the lock but slept outside it, so
+        other threads can still take tokens and — more importantly —
+        on_failure() can cut the rate immediately after a 429 instead
+        of queueing behind a sleeper.
+        """
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_refill) * self.rate
+                )
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def on_failure(self):
+        """Halve the rate after a 429 (multiplicative decrease)."""
+        with self._lock:
+            if self.rate > 0:
+                self.rate = max(self.initial_rate * 0.1, self.rate * 0.5)
+
+    def on_success(self):
+        """Creep the rate back toward its configured value (additive increase)."""
+        with self._lock:
+            if 0 < self.rate < self.initial_rate:
+                self.rate = min(self.initial_rate, self.rate + self.initial_rate * 0.05)
+
+
+@dataclass(slots=True, frozen=True)
 class NerdGraphResponse:
     """Response wrapper for NerdGraph API calls."""
     data: Optional[Dict[str, Any]]
-    errors: Optional[List[Dict[str, Any]]]
+    errors: Optional[List[Dict[str, Any]]] = None
 
     @property
     def is_success(self) -> bool:
-        return self.errors is None or len(self.errors) == 0
+        return not self.errors
 
 
 class NewRelicClient:
@@ -48,13 +646,35 @@ class NewRelicClient:
         api_key: str,
         account_id: str,
         region: str = "US",
-        rate_limit: float = 5.0
+        rate_limit: float = 5.0,
+        transport: str = "requests",
+        cache_dir: Optional[str] = None
     ):
         self.api_key = api_key
         self.account_id = account_id
+        # NerdGraph takes the account id as an Int; convert once instead
+        # of per pagination iteration.
+        self._account_id_int = int(account_id)
+        self._base_variables = {"accountId": self._account_id_int}
         self.region = region.upper()
         self.rate_limit = rate_limit
-        self._last_request_time = 0.0
+        self._bucket = TokenBucket(rate_limit)
+
+        # Shared pool for per-entity detail fetches; sized from the rate
+        # limit since the workload is network-latency-bound.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(16, int(rate_limit) or 1))
+        )
+
+        # Optional on-disk entity cache so a re-run only pays network
+        # cost for entities it has not seen recently.
+        self._cache = None
+        if cache_dir is not None:
+            if diskcache is None:
+                raise ImportError(
+                    "diskcache is required for cache_dir (pip install diskcache)"
+                )
+            self._cache = diskcache.Cache(cache_dir)
 
         # Set endpoint based on region
         if self.region == "EU":
@@ -64,56 +684,229 @@ class NewRelicClient:
 
         # Configure session with retries
         self.session = requests.Session()
+        # allowed_methods must name POST explicitly: urllib3 excludes it
+        # by default, which made this retry policy a silent no-op for
+        # the GraphQL endpoint. Jitter desynchronizes concurrent workers
+        # retrying the same 5xx window. 429 is deliberately NOT in the
+        # forcelist: the adaptive loop in execute_query owns rate-limit
+        # handling (Retry-After, AIMD bucket feedback) and must see the
+        # response rather than have the adapter consume it.
         retries = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            backoff_jitter=1.0,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset(["POST", "GET"]),
+            respect_retry_after_header=True
+        )
+        # Size the pool for the thread fan-out: requests' default of 10
+        # connections forces extra TLS handshakes once workers exceed it.
+        adapter = HTTPAdapter(
+            max_retries=retries,
+            pool_connections=32,
+            pool_maxsize=64
         )
-        adapter = HTTPAdapter(max_retries=retries)
         self.session.mount("https://", adapter)
+        # JSON responses compress 5-10x; advertise gzip/brotli so large
+        # dashboard payloads arrive compressed.
         self.session.headers.update({
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, br",
             "API-Key": self.api_key
         })
 
+        # Optional httpx transport: HTTP/2 multiplexes the threaded
+        # GraphQL fan-out over one TLS connection instead of paying a
+        # handshake per pooled HTTP/1.1 socket.
+        self.transport = transport
+        self._httpx_client = None
+        if transport == "httpx":
+            if httpx is None:
+                raise ImportError(
+                    "httpx is required for transport='httpx' "
+                    "(pip install httpx[http2])"
+                )
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+            self._httpx_client = httpx.Client(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max(10, int(rate_limit) * 4),
+                    max_keepalive_connections=max(10, int(rate_limit) * 4)
+                ),
+                timeout=60,
+                transport=httpx.HTTPTransport(retries=3),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept-Encoding": "gzip, br",
+                    "API-Key": self.api_key
+                }
+            )
+        elif transport != "requests":
+            raise ValueError(f"Unknown transport: {transport}")
+
+    def close(self):
+        """Release pooled connections and worker threads."""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+        if self._httpx_client is not None:
+            self._httpx_client.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def __enter__(self) -> "NewRelicClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _rate_limit_wait(self):
-        """Implement rate limiting between requests."""
-        if self.rate_limit > 0:
-            elapsed = time.time() - self._last_request_time
-            min_interval = 1.0 / self.rate_limit
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-        self._last_request_time = time.time()
+        """Implement rate limiting between requests (thread-safe)."""
+        self._bucket.acquire()
 
     def execute_query(
         self,
         query: str,
-        variables: Optional[Dict[str, Any]] = None
-    ) -> NerdGraphResponse:
-        """Execute a NerdGraph GraphQL query."""
+        variables: Optional[Dict[str, Any]] = None,
+        response_type: Optional[type] = None
+    ) -> Any:
+        """Execute a NerdGraph GraphQL query.
+
+        With ``response_type`` set (requires msgspec), the raw response
+        bytes are decoded straight into that Struct type and returned,
+        skipping the dict intermediate; otherwise a NerdGraphResponse
+        wraps the parsed dict as usual.
+        """
+        if response_type is not None and msgspec is None:
+            raise ImportError(
+                "msgspec is required for response_type (pip install msgspec)"
+            )
         self._rate_limit_wait()
 
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
 
+        errors = (requests.exceptions.RequestException,)
+        if httpx is not None:
+            errors += (httpx.HTTPError,)
+
         try:
-            response = self.session.post(
-                self.graphql_endpoint,
-                json=payload,
-                timeout=60
-            )
+            # Pre-serialize once with orjson (bytes) so requests doesn't
+            # re-encode the payload with stdlib json.dumps.
+            body = _json_bytes(payload)
+            headers = None
+            if len(body) > _GZIP_MIN_BYTES:
+                # NerdGraph accepts gzipped request bodies; batch guid
+                # queries are the main payloads big enough to benefit.
+                body = gzip.compress(body, compresslevel=6)
+                headers = {"Content-Encoding": "gzip"}
+            for attempt in range(5):
+                if self._httpx_client is not None:
+                    response = self._httpx_client.post(
+                        self.graphql_endpoint,
+                        content=body,
+                        headers=headers
+                    )
+                else:
+                    response = self.session.post(
+                        self.graphql_endpoint,
+                        data=body,
+                        headers=headers,
+                        timeout=60
+                    )
+                if response.status_code != 429:
+                    break
+                # Back off with jitter, honoring Retry-After, and shed
+                # rate so parallel workers don't retry in lock-step.
+                self._bucket.on_failure()
+                delay = min(60.0, max(
+                    _parse_retry_after(response.headers.get("Retry-After")),
+                    random.uniform(0, 2 ** attempt)
+                ))
+                logger.warning(
+                    "NerdGraph rate limited, backing off",
+                    attempt=attempt, delay=round(delay, 2)
+                )
+                time.sleep(delay)
             response.raise_for_status()
-            result = response.json()
+            self._bucket.on_success()
+            if response_type is not None:
+                # msgspec decodes into __slots__ Structs, ~2x faster
+                # than a dict parse and far lighter per entity.
+                return msgspec.json.decode(response.content, type=response_type)
+            try:
+                # bytes-in is orjson's fast path; avoids the UTF-8
+                # decode-to-str step that response.json() performs.
+                result = _json.loads(response.content)
+            except _json.JSONDecodeError:
+                result = response.json()
 
             return NerdGraphResponse(
                 data=result.get("data"),
                 errors=result.get("errors")
             )
-        except requests.exceptions.RequestException as e:
+        except errors as e:
             logger.error("NerdGraph API error", error=str(e))
+            if response_type is not None:
+                raise
             return NerdGraphResponse(data=None, errors=[{"message": str(e)}])
 
+    def execute_query_stream(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        items_path: str = "data.actor.entitySearch.results.entities.item"
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Execute a NerdGraph query and yield items incrementally.
+
+        Parses the response body with ijson as it arrives instead of
+        materializing the full JSON tree, keeping peak memory flat for
+        responses with thousands of entities. Falls back to a buffered
+        execute_query when ijson is unavailable or a non-requests
+        transport is in use.
+        """
+        if ijson is None or self._httpx_client is not None:
+            response = self.execute_query(query, variables)
+            if not response.is_success or not response.data:
+                return
+            # items_path starts at "data."; walk the remaining keys.
+            node: Any = response.data
+            for key in items_path.split(".")[1:-1]:
+                if node is None:
+                    return
+                node = node.get(key)
+            if node:
+                yield from node
+            return
+
+        self._rate_limit_wait()
+
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = variables
+
+        response = None
+        try:
+            response = self.session.post(
+                self.graphql_endpoint,
+                data=_json.dumps(payload),
+                timeout=60,
+                stream=True
+            )
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, items_path)
+        except requests.exceptions.RequestException as e:
+            logger.error("NerdGraph streaming query error", error=str(e))
+        finally:
+            if response is not None:
+                response.close()
+
     def _paginate_query(
         self,
         query: str,
@@ -124,6 +917,8 @@ class NewRelicClient:
         """Handle cursor-based pagination for NerdGraph queries."""
         cursor = None
         variables = variables or {}
+        get_results = _compile_path(tuple(path_to_results))
+        get_cursor = _compile_path(tuple(path_to_cursor))
 
         while True:
             variables["cursor"] = cursor
@@ -133,25 +928,11 @@ class NewRelicClient:
                 logger.error("Pagination query failed", errors=response.errors)
                 break
 
-            # Navigate to results
-            data = response.data
-            for key in path_to_results:
-                if data is None:
-                    break
-                data = data.get(key)
+            results = get_results(response.data)
+            if results:
+                yield from results
 
-            if data:
-                for item in data:
-                    yield item
-
-            # Get next cursor
-            cursor_data = response.data
-            for key in path_to_cursor:
-                if cursor_data is None:
-                    break
-                cursor_data = cursor_data.get(key)
-
-            cursor = cursor_data
+            cursor = get_cursor(response.data)
             if not cursor:
                 break
 
@@ -161,34 +942,12 @@ class NewRelicClient:
 
     def get_all_dashboards(self) -> List[Dict[str, Any]]:
         """Export all dashboards from the account."""
-        query = """
-        query($accountId: Int!, $cursor: String) {
-            actor {
-                entitySearch(
-                    query: "accountId = $accountId AND type = 'DASHBOARD'"
-                    options: { limit: 200 }
-                ) {
-                    results(cursor: $cursor) {
-                        entities {
-                            guid
-                            name
-                            ... on DashboardEntityOutline {
-                                dashboardParentGuid
-                            }
-                        }
-                        nextCursor
-                    }
-                }
-            }
-        }
-        """
-
         dashboards = []
         cursor = None
 
         while True:
-            response = self.execute_query(query, {
-                "accountId": int(self.account_id),
+            response = self.execute_query(_DASHBOARDS_LIST_QUERY, {
+                **self._base_variables,
                 "cursor": cursor
             })
 
@@ -199,106 +958,84 @@ class NewRelicClient:
             results = response.data["actor"]["entitySearch"]["results"]
             entities = results.get("entities", [])
 
-            for entity in entities:
-                # Get full dashboard definition
-                full_dashboard = self.get_dashboard_definition(entity["guid"])
-                if full_dashboard:
-                    dashboards.append(full_dashboard)
+            # Fetch full definitions 25 guids per request, with the
+            # batches themselves running in parallel on the pool.
+            futures = [
+                self._executor.submit(self.get_dashboard_definitions_batch, chunk)
+                for chunk in _chunked([e["guid"] for e in entities], _GUID_BATCH_SIZE)
+            ]
+            for future in futures:
+                dashboards.extend(future.result())
 
             cursor = results.get("nextCursor")
             if not cursor:
                 break
 
-        logger.info(f"Exported {len(dashboards)} dashboards")
+        logger.info("Exported dashboards", count=len(dashboards))
         return dashboards
 
     def get_dashboard_definition(self, guid: str) -> Optional[Dict[str, Any]]:
         """Get full dashboard definition by GUID."""
-        query = """
-        query($guid: EntityGuid!) {
-            actor {
-                entity(guid: $guid) {
-                    ... on DashboardEntity {
-                        guid
-                        name
-                        description
-                        permissions
-                        pages {
-                            guid
-                            name
-                            description
-                            widgets {
-                                id
-                                title
-                                layout {
-                                    column
-                                    row
-                                    width
-                                    height
-                                }
-                                visualization {
-                                    id
-                                }
-                                rawConfiguration
-                            }
-                        }
-                        variables {
-                            name
-                            type
-                            defaultValues
-                            isMultiSelection
-                            items {
-                                title
-                                value
-                            }
-                            nrqlQuery {
-                                accountIds
-                                query
-                            }
-                            replacementStrategy
-                        }
-                    }
-                }
-            }
-        }
-        """
-
-        response = self.execute_query(query, {"guid": guid})
+        response = self.execute_query(_DASHBOARD_DEFINITION_QUERY, {"guid": guid})
         if response.is_success and response.data:
             return response.data["actor"]["entity"]
         return None
 
+    def _entities_batch_cached(
+        self,
+        prefix: str,
+        query: str,
+        guids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Run an entities(guids:) batch query, serving cached guids locally."""
+        if self._cache is None:
+            response = self.execute_query(query, {"guids": guids})
+            if response.is_success and response.data:
+                return [e for e in response.data["actor"]["entities"] if e and e.get("guid")]
+            return []
+
+        found: Dict[str, Dict[str, Any]] = {}
+        misses = []
+        for guid in guids:
+            cached = self._cache.get(f"{prefix}:{guid}")
+            if cached is not None:
+                found[guid] = cached
+            else:
+                misses.append(guid)
+
+        if misses:
+            response = self.execute_query(query, {"guids": misses})
+            if response.is_success and response.data:
+                for entity in response.data["actor"]["entities"]:
+                    if entity and entity.get("guid"):
+                        found[entity["guid"]] = entity
+                        self._cache.set(
+                            f"{prefix}:{entity['guid']}",
+                            entity,
+                            expire=_ENTITY_CACHE_TTL_SECONDS
+                        )
+
+        return [found[guid] for guid in guids if guid in found]
+
+    def get_dashboard_definitions_batch(
+        self,
+        guids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Get full dashboard definitions for up to 25 GUIDs in one query."""
+        return self._entities_batch_cached("dash", _DASHBOARD_BATCH_QUERY, guids)
+
     # =========================================================================
     # Alert Export Methods
     # =========================================================================
 
     def get_all_alert_policies(self) -> List[Dict[str, Any]]:
         """Export all alert policies and their conditions."""
-        query = """
-        query($accountId: Int!, $cursor: String) {
-            actor {
-                account(id: $accountId) {
-                    alerts {
-                        policiesSearch(cursor: $cursor) {
-                            policies {
-                                id
-                                name
-                                incidentPreference
-                            }
-                            nextCursor
-                        }
-                    }
-                }
-            }
-        }
-        """
-
         policies = []
         cursor = None
 
         while True:
-            response = self.execute_query(query, {
-                "accountId": int(self.account_id),
+            response = self.execute_query(_ALERT_POLICIES_QUERY, {
+                **self._base_variables,
                 "cursor": cursor
             })
 
@@ -307,77 +1044,59 @@ class NewRelicClient:
                 break
 
             search_result = response.data["actor"]["account"]["alerts"]["policiesSearch"]
-            policy_list = search_result.get("policies", [])
-
-            for policy in policy_list:
-                # Get conditions for each policy
-                conditions = self.get_alert_conditions(policy["id"])
-                policy["conditions"] = conditions
-                policies.append(policy)
+            policies.extend(search_result.get("policies", []))
 
             cursor = search_result.get("nextCursor")
             if not cursor:
                 break
 
-        logger.info(f"Exported {len(policies)} alert policies")
+        # One unfiltered condition scan covers the whole account; join to
+        # policies client-side instead of issuing a search per policy.
+        conditions_by_policy: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for condition in self.get_all_nrql_conditions():
+            conditions_by_policy[str(condition.get("policyId"))].append(condition)
+
+        for policy in policies:
+            policy["conditions"] = conditions_by_policy.get(str(policy["id"]), [])
+
+        logger.info("Exported alert policies", count=len(policies))
         return policies
 
+    def get_all_nrql_conditions(self) -> List[Dict[str, Any]]:
+        """Export every NRQL condition in the account in one cursor scan."""
+        conditions = []
+        cursor = None
+
+        while True:
+            response = self.execute_query(_ALL_NRQL_CONDITIONS_QUERY, {
+                **self._base_variables,
+                "cursor": cursor
+            })
+
+            if not response.is_success:
+                logger.error("Failed to fetch NRQL conditions", errors=response.errors)
+                break
+
+            search_result = response.data["actor"]["account"]["alerts"]["nrqlConditionsSearch"]
+            for condition in search_result.get("nrqlConditions", []):
+                condition["conditionType"] = "NRQL"
+                conditions.append(condition)
+
+            cursor = search_result.get("nextCursor")
+            if not cursor:
+                break
+
+        return conditions
+
     def get_alert_conditions(self, policy_id: str) -> List[Dict[str, Any]]:
         """Get all conditions for an alert policy."""
         # NRQL Conditions
-        nrql_query = """
-        query($accountId: Int!, $policyId: ID!, $cursor: String) {
-            actor {
-                account(id: $accountId) {
-                    alerts {
-                        nrqlConditionsSearch(
-                            searchCriteria: { policyId: $policyId }
-                            cursor: $cursor
-                        ) {
-                            nrqlConditions {
-                                id
-                                name
-                                type
-                                enabled
-                                nrql {
-                                    query
-                                }
-                                signal {
-                                    aggregationWindow
-                                    aggregationMethod
-                                    aggregationDelay
-                                    fillOption
-                                    fillValue
-                                }
-                                terms {
-                                    threshold
-                                    thresholdDuration
-                                    thresholdOccurrences
-                                    operator
-                                    priority
-                                }
-                                expiration {
-                                    closeViolationsOnExpiration
-                                    expirationDuration
-                                    openViolationOnExpiration
-                                }
-                                runbookUrl
-                                description
-                            }
-                            nextCursor
-                        }
-                    }
-                }
-            }
-        }
-        """
-
         conditions = []
         cursor = None
 
         while True:
-            response = self.execute_query(nrql_query, {
-                "accountId": int(self.account_id),
+            response = self.execute_query(_NRQL_CONDITIONS_QUERY, {
+                **self._base_variables,
                 "policyId": policy_id,
                 "cursor": cursor
             })
@@ -400,36 +1119,12 @@ class NewRelicClient:
 
     def get_notification_channels(self) -> List[Dict[str, Any]]:
         """Export all notification channels/destinations."""
-        query = """
-        query($accountId: Int!, $cursor: String) {
-            actor {
-                account(id: $accountId) {
-                    aiNotifications {
-                        destinations(cursor: $cursor) {
-                            entities {
-                                id
-                                name
-                                type
-                                active
-                                properties {
-                                    key
-                                    value
-                                }
-                            }
-                            nextCursor
-                        }
-                    }
-                }
-            }
-        }
-        """
-
         channels = []
         cursor = None
 
         while True:
-            response = self.execute_query(query, {
-                "accountId": int(self.account_id),
+            response = self.execute_query(_NOTIFICATION_CHANNELS_QUERY, {
+                **self._base_variables,
                 "cursor": cursor
             })
 
@@ -445,7 +1140,7 @@ class NewRelicClient:
             if not cursor:
                 break
 
-        logger.info(f"Exported {len(channels)} notification channels")
+        logger.info("Exported notification channels", count=len(channels))
         return channels
 
     # =========================================================================
@@ -454,36 +1149,12 @@ class NewRelicClient:
 
     def get_all_synthetic_monitors(self) -> List[Dict[str, Any]]:
         """Export all synthetic monitors."""
-        query = """
-        query($accountId: Int!, $cursor: String) {
-            actor {
-                entitySearch(
-                    query: "accountId = $accountId AND type = 'SYNTHETIC_MONITOR'"
-                    options: { limit: 200 }
-                ) {
-                    results(cursor: $cursor) {
-                        entities {
-                            guid
-                            name
-                            ... on SyntheticMonitorEntityOutline {
-                                monitorType
-                                monitoredUrl
-                                period
-                            }
-                        }
-                        nextCursor
-                    }
-                }
-            }
-        }
-        """
-
         monitors = []
         cursor = None
 
         while True:
-            response = self.execute_query(query, {
-                "accountId": int(self.account_id),
+            response = self.execute_query(_SYNTHETIC_MONITORS_LIST_QUERY, {
+                **self._base_variables,
                 "cursor": cursor
             })
 
@@ -493,68 +1164,38 @@ class NewRelicClient:
             results = response.data["actor"]["entitySearch"]["results"]
             entities = results.get("entities", [])
 
-            for entity in entities:
-                full_monitor = self.get_synthetic_monitor_details(entity["guid"])
-                if full_monitor:
-                    monitors.append(full_monitor)
+            futures = [
+                self._executor.submit(self.get_synthetic_monitor_details_batch, chunk)
+                for chunk in _chunked([e["guid"] for e in entities], _GUID_BATCH_SIZE)
+            ]
+            for future in futures:
+                monitors.extend(future.result())
 
             cursor = results.get("nextCursor")
             if not cursor:
                 break
 
-        logger.info(f"Exported {len(monitors)} synthetic monitors")
+        logger.info("Exported synthetic monitors", count=len(monitors))
         return monitors
 
     def get_synthetic_monitor_details(self, guid: str) -> Optional[Dict[str, Any]]:
         """Get full synthetic monitor configuration."""
-        query = """
-        query($guid: EntityGuid!) {
-            actor {
-                entity(guid: $guid) {
-                    ... on SyntheticMonitorEntity {
-                        guid
-                        name
-                        monitorType
-                        monitoredUrl
-                        period
-                        status
-                        monitorSummary {
-                            status
-                            successRate
-                        }
-                        tags {
-                            key
-                            values
-                        }
-                    }
-                }
-            }
-        }
-        """
-
-        response = self.execute_query(query, {"guid": guid})
+        response = self.execute_query(_SYNTHETIC_MONITOR_DETAILS_QUERY, {"guid": guid})
         if response.is_success and response.data:
             return response.data["actor"]["entity"]
         return None
 
+    def get_synthetic_monitor_details_batch(
+        self,
+        guids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Get synthetic monitor configurations for up to 25 GUIDs in one query."""
+        return self._entities_batch_cached("synth", _SYNTHETIC_MONITOR_BATCH_QUERY, guids)
+
     def get_synthetic_monitor_script(self, monitor_guid: str) -> Optional[str]:
         """Get script for scripted synthetic monitors."""
-        query = """
-        query($accountId: Int!, $monitorGuid: EntityGuid!) {
-            actor {
-                account(id: $accountId) {
-                    synthetics {
-                        script(monitorGuid: $monitorGuid) {
-                            text
-                        }
-                    }
-                }
-            }
-        }
-        """
-
-        response = self.execute_query(query, {
-            "accountId": int(self.account_id),
+        response = self.execute_query(_SYNTHETIC_SCRIPT_QUERY, {
+            **self._base_variables,
             "monitorGuid": monitor_guid
         })
 
@@ -570,54 +1211,12 @@ class NewRelicClient:
 
     def get_all_slos(self) -> List[Dict[str, Any]]:
         """Export all Service Level Objectives."""
-        query = """
-        query($accountId: Int!, $cursor: String) {
-            actor {
-                account(id: $accountId) {
-                    serviceLevel {
-                        indicators(cursor: $cursor) {
-                            entities {
-                                guid
-                                name
-                                description
-                                objectives {
-                                    target
-                                    timeWindow {
-                                        rolling {
-                                            count
-                                            unit
-                                        }
-                                    }
-                                }
-                                events {
-                                    validEvents {
-                                        from
-                                        where
-                                    }
-                                    goodEvents {
-                                        from
-                                        where
-                                    }
-                                    badEvents {
-                                        from
-                                        where
-                                    }
-                                }
-                            }
-                            nextCursor
-                        }
-                    }
-                }
-            }
-        }
-        """
-
         slos = []
         cursor = None
 
         while True:
-            response = self.execute_query(query, {
-                "accountId": int(self.account_id),
+            response = self.execute_query(_SLOS_QUERY, {
+                **self._base_variables,
                 "cursor": cursor
             })
 
@@ -632,7 +1231,7 @@ class NewRelicClient:
             if not cursor:
                 break
 
-        logger.info(f"Exported {len(slos)} SLOs")
+        logger.info("Exported SLOs", count=len(slos))
         return slos
 
     # =========================================================================
@@ -641,36 +1240,12 @@ class NewRelicClient:
 
     def get_all_workloads(self) -> List[Dict[str, Any]]:
         """Export all workloads."""
-        query = """
-        query($accountId: Int!, $cursor: String) {
-            actor {
-                entitySearch(
-                    query: "accountId = $accountId AND type = 'WORKLOAD'"
-                    options: { limit: 200 }
-                ) {
-                    results(cursor: $cursor) {
-                        entities {
-                            guid
-                            name
-                            ... on WorkloadEntityOutline {
-                                workloadStatus {
-                                    statusValue
-                                }
-                            }
-                        }
-                        nextCursor
-                    }
-                }
-            }
-        }
-        """
-
         workloads = []
         cursor = None
 
         while True:
-            response = self.execute_query(query, {
-                "accountId": int(self.account_id),
+            response = self.execute_query(_WORKLOADS_LIST_QUERY, {
+                **self._base_variables,
                 "cursor": cursor
             })
 
@@ -680,68 +1255,73 @@ class NewRelicClient:
             results = response.data["actor"]["entitySearch"]["results"]
             entities = results.get("entities", [])
 
-            for entity in entities:
-                full_workload = self.get_workload_details(entity["guid"])
-                if full_workload:
-                    workloads.append(full_workload)
+            futures = [
+                self._executor.submit(self.get_workload_details_batch, chunk)
+                for chunk in _chunked([e["guid"] for e in entities], _GUID_BATCH_SIZE)
+            ]
+            for future in futures:
+                workloads.extend(future.result())
 
             cursor = results.get("nextCursor")
             if not cursor:
                 break
 
-        logger.info(f"Exported {len(workloads)} workloads")
+        logger.info("Exported workloads", count=len(workloads))
         return workloads
 
     def get_workload_details(self, guid: str) -> Optional[Dict[str, Any]]:
         """Get full workload configuration."""
-        query = """
-        query($guid: EntityGuid!) {
-            actor {
-                entity(guid: $guid) {
-                    ... on WorkloadEntity {
-                        guid
-                        name
-                        collection {
-                            guid
-                            name
-                            type
-                        }
-                        entitySearchQueries {
-                            query
-                        }
-                    }
-                }
-            }
-        }
-        """
-
-        response = self.execute_query(query, {"guid": guid})
+        response = self.execute_query(_WORKLOAD_DETAILS_QUERY, {"guid": guid})
         if response.is_success and response.data:
             return response.data["actor"]["entity"]
         return None
 
+    def get_workload_details_batch(self, guids: List[str]) -> List[Dict[str, Any]]:
+        """Get workload configurations for up to 25 GUIDs in one query."""
+        return self._entities_batch_cached("wl", _WORKLOAD_BATCH_QUERY, guids)
+
     # =========================================================================
     # Full Export Method
     # =========================================================================
 
-    def export_all(self) -> Dict[str, Any]:
-        """Export all supported configurations from New Relic."""
+    def export_all(self, output_dir: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Export all supported configurations from New Relic.
+
+        With ``output_dir`` set, each section is written to
+        ``{section}.ndjson`` as it completes and a small manifest is
+        returned instead of the data, so the full export never has to
+        sit in memory at once.
+        """
         logger.info("Starting full New Relic export", account_id=self.account_id)
 
-        export_data = {
+        # The six sections hit independent endpoints and share only the
+        # token bucket, so run them concurrently. A dedicated pool is
+        # used here: sections fan detail work out to self._executor, and
+        # running them on the same pool could exhaust it and deadlock.
+        sections = {
+            "dashboards": self.get_all_dashboards,
+            "alert_policies": self.get_all_alert_policies,
+            "notification_channels": self.get_notification_channels,
+            "synthetic_monitors": self.get_all_synthetic_monitors,
+            "slos": self.get_all_slos,
+            "workloads": self.get_all_workloads,
+        }
+        export_data: Dict[str, Any] = {
             "metadata": {
                 "account_id": self.account_id,
                 "region": self.region,
-                "export_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "export_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
                 "tool_version": "1.0.0"
-            },
-            "dashboards": self.get_all_dashboards(),
-            "alert_policies": self.get_all_alert_policies(),
-            "notification_channels": self.get_notification_channels(),
-            "synthetic_monitors": self.get_all_synthetic_monitors(),
-            "slos": self.get_all_slos(),
-            "workloads": self.get_all_workloads(),
+            }
         }
+        if output_dir is not None:
+            return self._export_all_to_dir(sections, export_data["metadata"], output_dir)
+
+        with ThreadPoolExecutor(max_workers=len(sections)) as pool:
+            futures = {name: pool.submit(fn) for name, fn in sections.items()}
+            for name, future in futures.items():
+                export_data[name] = future.result()
 
         logger.info(
             "Export complete",
@@ -753,3 +1333,36 @@ class NewRelicClient:
         )
 
         return export_data
+
+    def _export_all_to_dir(
+        self,
+        sections: Dict[str, Any],
+        metadata: Dict[str, Any],
+        output_dir: str
+    ) -> Dict[str, Any]:
+        """Stream each export section to NDJSON and return a manifest."""
+        os.makedirs(output_dir, exist_ok=True)
+
+        manifest: Dict[str, Any] = {"metadata": metadata, "sections": {}}
+        with ThreadPoolExecutor(max_workers=len(sections)) as pool:
+            futures = {name: pool.submit(fn) for name, fn in sections.items()}
+            for name, future in futures.items():
+                path = os.path.join(output_dir, f"{name}.ndjson")
+                count = 0
+                with open(path, "wb") as f:
+                    for entity in future.result():
+                        f.write(_json_bytes(entity))
+                        f.write(b"\n")
+                        count += 1
+                manifest["sections"][name] = {"path": path, "count": count}
+
+        manifest_path = os.path.join(output_dir, "manifest.json")
+        with open(manifest_path, "wb") as f:
+            f.write(_json_bytes(manifest))
+
+        logger.info(
+            "Export complete",
+            output_dir=output_dir,
+            **{name: info["count"] for name, info in manifest["sections"].items()}
+        )
+        return manifest
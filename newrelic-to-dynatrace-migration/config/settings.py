@@ -3,7 +3,9 @@ Configuration management for the New Relic to Dynatrace Migration Tool.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional, List
+from dotenv import dotenv_values
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
 
@@ -15,17 +17,23 @@ class NewRelicConfig(BaseSettings):
     account_id: str = Field(..., alias="NEW_RELIC_ACCOUNT_ID")
     region: str = Field(default="US", alias="NEW_RELIC_REGION")  # US or EU
 
+    @field_validator("region")
+    @classmethod
+    def normalize_region(cls, v: str) -> str:
+        """Uppercase once at load so endpoint lookups don't re-normalize."""
+        return v.upper()
+
     @property
     def graphql_endpoint(self) -> str:
         """Get the NerdGraph API endpoint based on region."""
-        if self.region.upper() == "EU":
+        if self.region == "EU":
             return "https://api.eu.newrelic.com/graphql"
         return "https://api.newrelic.com/graphql"
 
     @property
     def rest_api_base(self) -> str:
         """Get the REST API base URL based on region."""
-        if self.region.upper() == "EU":
+        if self.region == "EU":
             return "https://api.eu.newrelic.com/v2"
         return "https://api.newrelic.com/v2"
 
@@ -96,6 +104,18 @@ class MigrationConfig(BaseSettings):
     # Logging level
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
+    @field_validator("components", mode="before")
+    @classmethod
+    def split_components(cls, v):
+        """Accept a JSON or comma-separated string when passed as an init kwarg."""
+        if isinstance(v, str):
+            import json
+            try:
+                return json.loads(v)
+            except json.JSONDecodeError:
+                return [part.strip() for part in v.split(",") if part.strip()]
+        return v
+
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -114,17 +134,23 @@ class Settings:
 
     def _initialize(self):
         """Initialize all configuration sections."""
-        self.newrelic = NewRelicConfig()
-        self.dynatrace = DynatraceConfig()
-        self.migration = MigrationConfig()
+        # Read .env once and feed all three configs from the merged
+        # mapping; otherwise each BaseSettings subclass re-scans the
+        # environment and re-parses the file on construction.
+        env = {**dotenv_values(".env"), **os.environ}
+        self.newrelic = NewRelicConfig(_env_file=None, **env)
+        self.dynatrace = DynatraceConfig(_env_file=None, **env)
+        self.migration = MigrationConfig(_env_file=None, **env)
 
     @classmethod
     def reset(cls):
         """Reset singleton for testing."""
         cls._instance = None
+        get_settings.cache_clear()
 
 
 # Convenience function to get settings
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the settings singleton."""
     return Settings()
@@ -1,18 +1,25 @@
 """Transformer modules for converting New Relic entities to Dynatrace format."""
 
-from .mapping_rules import EntityMapper, ENTITY_MAPPINGS
-from .dashboard_transformer import DashboardTransformer
-from .alert_transformer import AlertTransformer
-from .synthetic_transformer import SyntheticTransformer
-from .slo_transformer import SLOTransformer
-from .workload_transformer import WorkloadTransformer
+# Submodules are imported lazily (PEP 562) so pulling in one transformer
+# doesn't load all five modules and their dependencies up front.
+_EXPORTS = {
+    "EntityMapper": "mapping_rules",
+    "ENTITY_MAPPINGS": "mapping_rules",
+    "DashboardTransformer": "dashboard_transformer",
+    "AlertTransformer": "alert_transformer",
+    "SyntheticTransformer": "synthetic_transformer",
+    "SLOTransformer": "slo_transformer",
+    "WorkloadTransformer": "workload_transformer",
+}
 
-__all__ = [
-    "EntityMapper",
-    "ENTITY_MAPPINGS",
-    "DashboardTransformer",
-    "AlertTransformer",
-    "SyntheticTransformer",
-    "SLOTransformer",
-    "WorkloadTransformer",
-]
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
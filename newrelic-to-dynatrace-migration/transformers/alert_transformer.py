@@ -2,10 +2,18 @@
 Alert Transformer - Converts New Relic alerts to Dynatrace format.
 """
 
+import multiprocessing
+import os
 import re
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
-import structlog
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+from dataclasses import dataclass, field
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator
+    ahocorasick = None
 
 from .mapping_rules import (
     EntityMapper,
@@ -16,22 +24,106 @@ from .mapping_rules import (
     FILL_OPTION_MAP,
 )
 
-logger = structlog.get_logger()
+# structlog is imported on first log call rather than at module import,
+# keeping this module cheap to load for callers that never transform.
+_logger = None
+
+
+def _log():
+    global _logger
+    if _logger is None:
+        import structlog
+        _logger = structlog.get_logger()
+    return _logger
+
+# Common NRQL metric patterns and their Dynatrace equivalents,
+# priority-ordered: when a query mentions several, the earliest table
+# entry wins. Compiled once into a single alternation so extraction is
+# one C-level scan instead of 13 Python substring checks per condition.
+_METRIC_TABLE = (
+    ("transactionduration", "builtin:service.response.time"),
+    ("duration", "builtin:service.response.time"),
+    ("apdex", "builtin:service.response.time"),
+    ("error", "builtin:service.errors.total.rate"),
+    ("errorrate", "builtin:service.errors.total.rate"),
+    ("throughput", "builtin:service.requestCount.total"),
+    ("requestcount", "builtin:service.requestCount.total"),
+    ("cpupercent", "builtin:host.cpu.usage"),
+    ("cpu", "builtin:host.cpu.usage"),
+    ("memorypercent", "builtin:host.mem.usage"),
+    ("memory", "builtin:host.mem.usage"),
+    ("diskpercent", "builtin:host.disk.usedPct"),
+    ("disk", "builtin:host.disk.usedPct"),
+)
+_METRIC_RE = re.compile(
+    "|".join(f"({re.escape(k)})" for k, _ in _METRIC_TABLE),
+    re.IGNORECASE
+)
+
+# Metric and dimension keys are copied into every generated query
+# definition. Identifier-like literals (STATIC_THRESHOLD, ABOVE, ...)
+# are interned by the compiler already; these dotted strings are not,
+# so intern them once here and every event shares one object.
+_METRIC_TABLE = tuple((k, sys.intern(v)) for k, v in _METRIC_TABLE)
+_PLACEHOLDER_METRIC = sys.intern("builtin:tech.generic.placeholder")
+_SERVICE_DIMENSION = sys.intern("dt.entity.service")
+
+
+def _build_metric_automaton():
+    """Aho-Corasick automaton over the metric keywords, if available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, (keyword, _) in enumerate(_METRIC_TABLE):
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+
+_METRIC_AUTOMATON = _build_metric_automaton()
+
+# Term priorities as New Relic exports them; membership tests against
+# these avoid lowercasing every term's priority string. Unusual casing
+# still falls back to .lower() in _build_monitoring_strategy.
+_CRITICAL_PRIORITIES = frozenset(("critical", "CRITICAL", "Critical"))
+_WARNING_PRIORITIES = frozenset(("warning", "WARNING", "Warning"))
+
+# Bound lookup for the operator mapping, resolved once at import
+_OPERATOR_GET = OPERATOR_MAP.get
+
+# Dynatrace evaluates one sample per minute; used to turn New Relic
+# threshold durations (seconds) into sample counts.
+_SECS_PER_SAMPLE = 60
+
+# Shared .get() default for absent nested dicts; never mutated, so one
+# instance avoids allocating a fresh empty dict per lookup.
+_EMPTY: Dict[str, Any] = {}
+
+# Name prefixes stamped on every migrated entity; concatenation with a
+# module constant beats re-formatting the literal into each f-string.
+_MIG = "[Migrated] "
+_MIG_MANUAL = "[Migrated - Manual Config Required] "
+
+# Severity levels included in every migrated alerting profile. The rule
+# dicts themselves are built per call (callers may mutate the profile),
+# but the skeleton lives here instead of being re-typed as a literal.
+_SEVERITY_LEVELS = (
+    "AVAILABILITY",
+    "ERROR",
+    "PERFORMANCE",
+    "RESOURCE_CONTENTION",
+    "CUSTOM_ALERT",
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertTransformResult:
     """Result of alert transformation."""
     success: bool
     alerting_profile: Optional[Dict[str, Any]] = None
-    metric_events: List[Dict[str, Any]] = None
-    warnings: List[str] = None
-    errors: List[str] = None
-
-    def __post_init__(self):
-        self.metric_events = self.metric_events or []
-        self.warnings = self.warnings or []
-        self.errors = self.errors or []
+    metric_events: List[Dict[str, Any]] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
 
 
 class AlertTransformer:
@@ -63,28 +155,14 @@ class AlertTransformer:
             alerting_profile = self._create_alerting_profile(nr_policy)
 
             # Transform conditions to metric events
-            conditions = nr_policy.get("conditions", [])
-            metric_events = []
-
-            for condition in conditions:
-                event_result = self._transform_condition(
-                    condition=condition,
-                    policy_name=policy_name
-                )
-
-                if event_result["metric_event"]:
-                    metric_events.append(event_result["metric_event"])
-
-                if event_result["warnings"]:
-                    warnings.extend(event_result["warnings"])
-
-                if event_result["errors"]:
-                    errors.extend(event_result["errors"])
+            metric_events = list(
+                self.iter_metric_events(nr_policy, warnings, errors)
+            )
 
-            logger.info(
+            _log().info(
                 "Transformed alert policy",
                 policy=policy_name,
-                conditions_count=len(conditions),
+                conditions_count=len(nr_policy.get("conditions", [])),
                 events_created=len(metric_events)
             )
 
@@ -97,12 +175,47 @@ class AlertTransformer:
             )
 
         except Exception as e:
-            logger.error("Alert policy transformation failed", error=str(e))
+            _log().error("Alert policy transformation failed", error=str(e))
             return AlertTransformResult(
                 success=False,
                 errors=[f"Transformation error: {str(e)}"]
             )
 
+    def iter_metric_events(
+        self,
+        nr_policy: Dict[str, Any],
+        warnings: Optional[List[str]] = None,
+        errors: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield metric events for a policy's conditions.
+
+        Warnings and errors are appended to the supplied lists as each
+        condition is processed, so callers can stream events for large
+        policies without materializing them all first.
+        """
+        if warnings is None:
+            warnings = []
+        if errors is None:
+            errors = []
+
+        policy_name = nr_policy.get("name", "Unnamed Policy")
+
+        for condition in nr_policy.get("conditions", []):
+            event_result = self._transform_condition(
+                condition=condition,
+                policy_name=policy_name
+            )
+
+            if event_result["warnings"]:
+                warnings.extend(event_result["warnings"])
+
+            if event_result["errors"]:
+                errors.extend(event_result["errors"])
+
+            if event_result["metric_event"]:
+                yield event_result["metric_event"]
+
     def _create_alerting_profile(self, nr_policy: Dict[str, Any]) -> Dict[str, Any]:
         """Create a Dynatrace alerting profile from New Relic policy."""
         policy_name = nr_policy.get("name", "Unnamed Policy")
@@ -110,34 +223,15 @@ class AlertTransformer:
 
         # Build alerting profile
         profile = {
-            "name": f"[Migrated] {policy_name}",
+            "name": _MIG + policy_name,
             "managementZone": None,
             "severityRules": [
                 {
-                    "severityLevel": "AVAILABILITY",
-                    "tagFilter": {"includeMode": "NONE"},
-                    "delayInMinutes": 0
-                },
-                {
-                    "severityLevel": "ERROR",
-                    "tagFilter": {"includeMode": "NONE"},
-                    "delayInMinutes": 0
-                },
-                {
-                    "severityLevel": "PERFORMANCE",
-                    "tagFilter": {"includeMode": "NONE"},
-                    "delayInMinutes": 0
-                },
-                {
-                    "severityLevel": "RESOURCE_CONTENTION",
-                    "tagFilter": {"includeMode": "NONE"},
-                    "delayInMinutes": 0
-                },
-                {
-                    "severityLevel": "CUSTOM_ALERT",
+                    "severityLevel": level,
                     "tagFilter": {"includeMode": "NONE"},
                     "delayInMinutes": 0
                 }
+                for level in _SEVERITY_LEVELS
             ],
             "eventTypeFilters": []
         }
@@ -178,26 +272,31 @@ class AlertTransformer:
         warnings: List[str]
     ) -> Dict[str, Any]:
         """Transform NRQL condition to metric event."""
-        condition_name = condition.get("name", "Unnamed Condition")
-        description = condition.get("description", "")
-        enabled = condition.get("enabled", True)
+        get = condition.get
+        condition_name = get("name", "Unnamed Condition")
+        description = get("description", "")
+        enabled = get("enabled", True)
 
         # Get NRQL query
-        nrql = condition.get("nrql", {})
-        query = nrql.get("query", "")
+        query = get("nrql", _EMPTY).get("query", "")
 
         # Get signal configuration
-        signal = condition.get("signal", {})
+        signal = get("signal", _EMPTY)
         aggregation_window = signal.get("aggregationWindow", 60)
         aggregation_method = signal.get("aggregationMethod", "EVENT_FLOW")
 
         # Get terms (thresholds)
-        terms = condition.get("terms", [])
+        terms = get("terms", [])
+
+        # Only build the fallback description (and slice the query)
+        # when the condition doesn't bring its own.
+        if not description:
+            description = f"Migrated from New Relic. Original NRQL: {query[:200]}"
 
         # Build metric event
         metric_event = {
-            "summary": f"[Migrated] {condition_name}",
-            "description": description or f"Migrated from New Relic. Original NRQL: {query[:200]}",
+            "summary": _MIG + condition_name,
+            "description": description,
             "enabled": enabled,
             "alertingScope": [
                 {
@@ -216,7 +315,7 @@ class AlertTransformer:
         }
 
         # Add runbook URL if present
-        runbook_url = condition.get("runbookUrl")
+        runbook_url = get("runbookUrl")
         if runbook_url:
             metric_event["description"] += f"\n\nRunbook: {runbook_url}"
 
@@ -243,16 +342,26 @@ class AlertTransformer:
         }
 
         if terms:
-            # Use the first critical term if available
+            # Single pass: a critical term always wins, so stop at the
+            # first one; otherwise remember the last warning term seen.
             critical_term = None
             warning_term = None
 
             for term in terms:
-                priority = term.get("priority", "critical").lower()
-                if priority == "critical":
+                priority = term.get("priority", "critical")
+                if priority in _CRITICAL_PRIORITIES:
                     critical_term = term
-                elif priority == "warning":
+                    break
+                if priority in _WARNING_PRIORITIES:
                     warning_term = term
+                else:
+                    # Unusual casing: normalize once and re-check
+                    priority = priority.lower()
+                    if priority == "critical":
+                        critical_term = term
+                        break
+                    if priority == "warning":
+                        warning_term = term
 
             # Use critical term, fall back to warning
             active_term = critical_term or warning_term
@@ -260,16 +369,15 @@ class AlertTransformer:
             if active_term:
                 # Map operator
                 operator = active_term.get("operator", "ABOVE")
-                strategy["alertCondition"] = OPERATOR_MAP.get(operator, "ABOVE")
+                strategy["alertCondition"] = _OPERATOR_GET(operator, "ABOVE")
 
                 # Set threshold
                 threshold = active_term.get("threshold", 0)
                 strategy["threshold"] = threshold
 
-                # Set duration
+                # Set duration; Dynatrace uses samples, one per minute
                 duration_seconds = active_term.get("thresholdDuration", 300)
-                # Dynatrace uses samples, assuming 1 sample per minute
-                samples = max(1, duration_seconds // 60)
+                samples = duration_seconds // _SECS_PER_SAMPLE or 1
                 strategy["samples"] = samples
                 strategy["violatingSamples"] = samples
 
@@ -294,14 +402,14 @@ class AlertTransformer:
                 f"Could not extract metric from NRQL: {nrql_query[:100]}... "
                 "Manual configuration required."
             )
-            metric_key = "builtin:tech.generic.placeholder"
+            metric_key = _PLACEHOLDER_METRIC
 
         return {
             "type": "METRIC_KEY",
             "metricKey": metric_key,
             "aggregation": "AVG",
             "entityFilter": {
-                "dimensionKey": "dt.entity.service",
+                "dimensionKey": _SERVICE_DIMENSION,
                 "conditions": []
             },
             "dimensionFilter": []
@@ -312,35 +420,39 @@ class AlertTransformer:
         Attempt to extract a metric identifier from NRQL query.
         Returns a Dynatrace metric key if possible.
         """
-        query_lower = query.lower()
-
-        # Common NRQL metric patterns and their Dynatrace equivalents
-        metric_mappings = {
-            "transactionduration": "builtin:service.response.time",
-            "duration": "builtin:service.response.time",
-            "apdex": "builtin:service.response.time",
-            "error": "builtin:service.errors.total.rate",
-            "errorrate": "builtin:service.errors.total.rate",
-            "throughput": "builtin:service.requestCount.total",
-            "requestcount": "builtin:service.requestCount.total",
-            "cpupercent": "builtin:host.cpu.usage",
-            "cpu": "builtin:host.cpu.usage",
-            "memorypercent": "builtin:host.mem.usage",
-            "memory": "builtin:host.mem.usage",
-            "diskpercent": "builtin:host.disk.usedPct",
-            "disk": "builtin:host.disk.usedPct",
-        }
-
-        for nrql_metric, dt_metric in metric_mappings.items():
-            if nrql_metric in query_lower:
-                return dt_metric
+        # Either way, the lowest table index among all hits wins,
+        # preserving the old first-mapping-that-occurs-anywhere
+        # semantics.
+        best = None
+
+        if _METRIC_AUTOMATON is not None:
+            # The automaton matches exact-case, so this path pays for
+            # one lowered copy; the multi-pattern scan is still faster
+            # than the regex alternation on long queries.
+            for _, index in _METRIC_AUTOMATON.iter(query.lower()):
+                if best is None or index < best:
+                    best = index
+                    if index == 0:
+                        break
+        else:
+            # One IGNORECASE scan with no .lower() copy; the matched
+            # group's index identifies the table entry.
+            for match in _METRIC_RE.finditer(query):
+                index = match.lastindex - 1
+                if best is None or index < best:
+                    best = index
+                    if index == 0:
+                        break
+
+        if best is not None:
+            return _METRIC_TABLE[best][1]
 
         return None
 
     def _create_placeholder_event(self, condition: Dict[str, Any]) -> Dict[str, Any]:
         """Create a placeholder metric event for unsupported condition types."""
         return {
-            "summary": f"[Migrated - Manual Config Required] {condition.get('name', 'Unknown')}",
+            "summary": _MIG_MANUAL + condition.get("name", "Unknown"),
             "description": (
                 f"This alert was migrated from New Relic but requires manual configuration.\n"
                 f"Original condition type: {condition.get('conditionType', 'Unknown')}"
@@ -358,19 +470,38 @@ class AlertTransformer:
 
     def transform_all(
         self,
-        policies: List[Dict[str, Any]]
+        policies: List[Dict[str, Any]],
+        workers: Optional[int] = None
     ) -> List[AlertTransformResult]:
-        """Transform multiple alert policies."""
-        results = []
+        """
+        Transform multiple alert policies.
 
-        for policy in policies:
-            result = self.transform_policy(policy)
-            results.append(result)
+        Small batches are transformed inline; large ones fan out over a
+        process pool (transformation is pure CPU, so threads wouldn't
+        help under the GIL). Result order matches the input order.
+        """
+        # The migrate orchestrator already shards big batches across its
+        # own pool and calls transform_all inside workers; spawning a
+        # nested pool per chunk there would fork cpu_count processes per
+        # chunk, so stay inline when this process is itself a worker.
+        cpu_count = os.cpu_count() or 1
+        if (
+            len(policies) < _PARALLEL_THRESHOLD
+            or cpu_count < 2
+            or multiprocessing.parent_process() is not None
+        ):
+            results = [self.transform_policy(policy) for policy in policies]
+        else:
+            chunksize = max(1, len(policies) // (cpu_count * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(
+                    _transform_one_policy, policies, chunksize=chunksize
+                ))
 
         successful = sum(1 for r in results if r.success)
         total_events = sum(len(r.metric_events) for r in results)
 
-        logger.info(
+        _log().info(
             f"Transformed {successful}/{len(results)} alert policies, "
             f"{total_events} metric events created"
         )
@@ -378,40 +509,59 @@ class AlertTransformer:
         return results
 
 
+# Policy counts below this are transformed inline; spawning worker
+# processes only pays off once the batch is large enough to amortize
+# interpreter startup and pickling.
+_PARALLEL_THRESHOLD = 64
+
+# Per-process transformer for pool workers, built lazily on first use.
+_WORKER_TRANSFORMER: Optional[AlertTransformer] = None
+
+
+def _transform_one_policy(policy: Dict[str, Any]) -> AlertTransformResult:
+    """Module-level worker for transform_all (methods don't pickle)."""
+    global _WORKER_TRANSFORMER
+    if _WORKER_TRANSFORMER is None:
+        _WORKER_TRANSFORMER = AlertTransformer()
+    return _WORKER_TRANSFORMER.transform_policy(policy)
+
+
 class NotificationTransformer:
     """
     Transforms New Relic notification channels to Dynatrace integrations.
     """
 
+    def __init__(self):
+        # Channel-type dispatch built once per transformer instead of
+        # an if/elif chain re-evaluated for every channel.
+        self._dispatch = {
+            "EMAIL": self._transform_email,
+            "SLACK": self._transform_slack,
+            "PAGERDUTY": self._transform_pagerduty,
+            "WEBHOOK": self._transform_webhook,
+        }
+
     def transform_channel(self, nr_channel: Dict[str, Any]) -> Dict[str, Any]:
         """Transform a notification channel."""
         channel_type = nr_channel.get("type", "").upper()
-        channel_name = nr_channel.get("name", "Unknown Channel")
-        properties = {p["key"]: p["value"] for p in nr_channel.get("properties", [])}
 
-        result = {
-            "success": False,
-            "integration_type": None,
-            "config": None,
-            "warnings": [],
-            "errors": []
-        }
-
-        if channel_type == "EMAIL":
-            result = self._transform_email(nr_channel, properties)
-        elif channel_type == "SLACK":
-            result = self._transform_slack(nr_channel, properties)
-        elif channel_type == "PAGERDUTY":
-            result = self._transform_pagerduty(nr_channel, properties)
-        elif channel_type == "WEBHOOK":
-            result = self._transform_webhook(nr_channel, properties)
-        else:
-            result["errors"].append(
-                f"Notification type '{channel_type}' for '{channel_name}' "
-                "is not yet supported for automatic migration"
-            )
+        handler = self._dispatch.get(channel_type)
+        if handler is None:
+            channel_name = nr_channel.get("name", "Unknown Channel")
+            return {
+                "success": False,
+                "integration_type": None,
+                "config": None,
+                "warnings": [],
+                "errors": [
+                    f"Notification type '{channel_type}' for '{channel_name}' "
+                    "is not yet supported for automatic migration"
+                ]
+            }
 
-        return result
+        # Only supported channels pay for the properties extraction
+        properties = {p["key"]: p["value"] for p in nr_channel.get("properties", [])}
+        return handler(nr_channel, properties)
 
     def _transform_email(
         self,
@@ -423,7 +573,7 @@ class NotificationTransformer:
             "success": True,
             "integration_type": "email",
             "config": {
-                "name": f"[Migrated] {channel.get('name', 'Email')}",
+                "name": _MIG + channel.get("name", "Email"),
                 "recipients": properties.get("recipients", "").split(","),
                 "subject": "[Dynatrace] {ProblemTitle}",
                 "body": "{ProblemDetailsText}",
@@ -443,7 +593,7 @@ class NotificationTransformer:
             "success": True,
             "integration_type": "slack",
             "config": {
-                "name": f"[Migrated] {channel.get('name', 'Slack')}",
+                "name": _MIG + channel.get("name", "Slack"),
                 "url": properties.get("url", ""),  # Webhook URL
                 "channel": properties.get("channel", ""),
                 "active": channel.get("active", True)
@@ -462,7 +612,7 @@ class NotificationTransformer:
             "success": True,
             "integration_type": "pagerduty",
             "config": {
-                "name": f"[Migrated] {channel.get('name', 'PagerDuty')}",
+                "name": _MIG + channel.get("name", "PagerDuty"),
                 "serviceKey": properties.get("service_key", ""),
                 "active": channel.get("active", True)
             },
@@ -482,7 +632,7 @@ class NotificationTransformer:
             "success": True,
             "integration_type": "webhook",
             "config": {
-                "name": f"[Migrated] {channel.get('name', 'Webhook')}",
+                "name": _MIG + channel.get("name", "Webhook"),
                 "url": properties.get("base_url", ""),
                 "acceptAnyCertificate": False,
                 "active": channel.get("active", True),
@@ -17,7 +17,7 @@ from .mapping_rules import (
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformResult:
     """Result of a transformation operation."""
     success: bool
@@ -11,7 +11,7 @@ from .mapping_rules import SLO_TIME_UNIT_MAP
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class SLOTransformResult:
     """Result of SLO transformation."""
     success: bool
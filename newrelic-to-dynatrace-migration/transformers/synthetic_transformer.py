@@ -14,7 +14,7 @@ from .mapping_rules import (
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class SyntheticTransformResult:
     """Result of synthetic monitor transformation."""
     success: bool
@@ -9,7 +9,7 @@ import structlog
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkloadTransformResult:
     """Result of workload transformation."""
     success: bool
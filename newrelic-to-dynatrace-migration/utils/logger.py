@@ -1,5 +1,6 @@
 """Logging configuration for the migration tool."""
 
+import logging
 import sys
 import structlog
 from typing import Optional
@@ -9,13 +10,17 @@ def setup_logging(level: str = "INFO") -> None:
     """Configure structured logging."""
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.dev.ConsoleRenderer()
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Filtering bound loggers return a no-op for disabled levels, so
+        # below-threshold calls skip kwarg formatting and the processor
+        # chain entirely.
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, level.upper(), logging.INFO)
+        ),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -11,18 +11,111 @@ Usage:
     python nrql_to_dql.py --file queries.txt
 """
 
+import functools
+import os
 import re
 import sys
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.syntax import Syntax
 
-console = Console()
+try:
+    # Optional: multi-pattern field search in strict O(n + matches)
+    # instead of regex alternation.
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: vectorized paren-depth scan for SELECT splitting.
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Optional: linear-time DFA regex engine, immune to catastrophic
+    # backtracking on adversarially long NRQL.
+    import re2
+except ImportError:
+    re2 = None
+
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile with RE2 when available, falling back to stdlib re.
+
+    Patterns using constructs RE2 lacks (lookarounds) silently keep
+    the backtracking engine.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, flags)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+
+@functools.cache
+def _console() -> "Console":
+    """Build the rich console on first render.
+
+    rich costs ~50ms of import time and is only needed when something
+    is actually displayed; programmatic converter use and pool workers
+    never pay for it.
+    """
+    from rich.console import Console
+    return Console()
+
+# =============================================================================
+# Precompiled patterns
+# =============================================================================
+# Compiled once at import so the hot conversion path skips the re-cache
+# lookup and flag normalization that re.search(str, ...) pays per call.
+
+# One alternation finds every clause keyword position in a single scan;
+# clause bodies are then recovered by slicing between adjacent matches,
+# instead of re-scanning the whole query once per clause with
+# (?:FACET|SINCE|...|$) lookahead tails.
+_RE_CLAUSE_KEYWORDS = _compile(
+    r"\b(SELECT|FROM|WHERE|FACET|SINCE|UNTIL|LIMIT|TIMESERIES"
+    r"|COMPARE\s+WITH|ORDER\s+BY)\b",
+    re.IGNORECASE
+)
+_RE_WORD = _compile(r"\w+")
+_RE_INT = _compile(r"\d+")
+_RE_TIMESERIES_ARGS = _compile(r"(\d+)\s+(\w+)")
+
+_RE_AGG = _compile(
+    r"(\w+)\s*\(\s*(.+?)\s*\)(?:\s+AS\s+['\"]?(\w+)['\"]?)?",
+    re.IGNORECASE
+)
+_RE_PERCENTILE_ARGS = _compile(r"(.+?),\s*(\d+)")
+_RE_RELATIVE_TIME = _compile(r"(\d+)\s+(minute|hour|day|week|month)s?\s+ago")
+
+# DQL spells relative ranges as now()-<value><suffix>; weeks and months
+# have no suffix of their own and are expressed in days.
+_TIME_UNIT_SUFFIX = {"minute": "m", "hour": "h", "day": "d", "week": "d", "month": "d"}
+_TIME_UNIT_MULTIPLIER = {"week": 7, "month": 30}
+
+# All operator and construct rewrites fused into one alternation so
+# the WHERE clause is scanned once. The = lookarounds leave >=, <=, !=
+# and == alone, which the old per-rule \s*=\s* substitution mangled.
+_RE_WHERE_REWRITE = _compile(
+    r"(?P<like>(?P<like_field>\w+(?:\.\w+)*)\s+LIKE\s+'(?P<like_pattern>[^']+)')"
+    r"|(?P<in>(?P<in_field>\w+(?:\.\w+)*)\s+IN\s*\((?P<in_values>[^)]+)\))"
+    r"|(?P<isnotnull>(?P<nn_field>\w+)\s+IS\s+NOT\s+NULL)"
+    r"|(?P<isnull>(?P<null_field>\w+)\s+IS\s+NULL)"
+    r"|(?P<and>\bAND\b)"
+    r"|(?P<or>\bOR\b)"
+    r"|(?P<not>\bNOT\b)"
+    r"|(?P<eq>\s*(?<![=!<>])=(?!=)\s*)",
+    re.IGNORECASE
+)
 
 
 class QueryType(Enum):
@@ -34,6 +127,25 @@ class QueryType(Enum):
     UNKNOWN = "unknown"
 
 
+@dataclass(slots=True)
+class ParsedNRQL:
+    """Parsed NRQL clauses, one slot per clause.
+
+    Slot attribute access skips the string hashing a dict lookup pays
+    on every read in the build stage, and drops the per-instance dict.
+    """
+    select: List[Dict[str, Any]] = field(default_factory=list)
+    from_: Optional[str] = None
+    where: Optional[str] = None
+    facet: Optional[List[str]] = None
+    since: Optional[str] = None
+    until: Optional[str] = None
+    limit: Optional[int] = None
+    timeseries: Optional[str] = None
+    compare_with: Optional[str] = None
+    order_by: Optional[str] = None
+
+
 @dataclass
 class ConversionResult:
     """Result of NRQL to DQL conversion."""
@@ -201,10 +313,16 @@ class NRQLtoDQLConverter:
         "NOT": "not",
     }
 
+    # Conversion is pure given the same input, and dashboard migrations
+    # hit the same query skeletons repeatedly; cache up to this many
+    # results per converter instance (FIFO eviction).
+    _RESULT_CACHE_MAX = 4096
+
     def __init__(self):
         self.warnings: List[str] = []
         self.manual_review: List[str] = []
         self.field_mappings_used: Dict[str, str] = {}
+        self._result_cache: Dict[str, ConversionResult] = {}
 
     def convert(self, nrql: str) -> ConversionResult:
         """
@@ -216,15 +334,29 @@ class NRQLtoDQLConverter:
         Returns:
             ConversionResult with the converted DQL and metadata
         """
+        # Normalize the query
+        nrql = self._normalize_query(nrql)
+
+        cached = self._result_cache.get(nrql)
+        if cached is not None:
+            # Hand out fresh containers so callers mutating the result
+            # can't poison the cached entry.
+            return replace(
+                cached,
+                warnings=cached.warnings.copy(),
+                manual_review_needed=cached.manual_review_needed.copy(),
+                field_mappings_used=cached.field_mappings_used.copy()
+            )
+
         self.warnings = []
         self.manual_review = []
         self.field_mappings_used = {}
 
-        # Normalize the query
-        nrql = self._normalize_query(nrql)
-
-        # Parse NRQL components
-        parsed = self._parse_nrql(nrql)
+        # Parse NRQL components (regex-free fast path for the common
+        # shape, general tokenizer otherwise)
+        parsed = self._fast_parse_common(nrql)
+        if parsed is None:
+            parsed = self._parse_nrql(nrql)
 
         # Determine query type
         query_type = self._determine_query_type(parsed)
@@ -235,7 +367,7 @@ class NRQLtoDQLConverter:
         # Determine confidence
         confidence = self._calculate_confidence()
 
-        return ConversionResult(
+        result = ConversionResult(
             original_nrql=nrql,
             converted_dql=dql,
             query_type=query_type,
@@ -245,6 +377,36 @@ class NRQLtoDQLConverter:
             field_mappings_used=self.field_mappings_used.copy()
         )
 
+        if len(self._result_cache) >= self._RESULT_CACHE_MAX:
+            self._result_cache.pop(next(iter(self._result_cache)))
+        self._result_cache[nrql] = result
+
+        # The cached entry keeps the pristine containers; hand the
+        # caller copies, same as the hit path above.
+        return replace(
+            result,
+            warnings=result.warnings.copy(),
+            manual_review_needed=result.manual_review_needed.copy(),
+            field_mappings_used=result.field_mappings_used.copy()
+        )
+
+    def convert_many(
+        self,
+        queries: List[str],
+        workers: Optional[int] = None
+    ) -> List[ConversionResult]:
+        """Convert a batch of NRQL queries, preserving input order.
+
+        Large batches fan out across CPU cores; small ones convert
+        inline where a process pool would cost more than it saves.
+        """
+        if len(queries) < _PARALLEL_THRESHOLD or (os.cpu_count() or 1) < 2:
+            return [self.convert(q) for q in queries]
+
+        chunksize = max(1, len(queries) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_convert_one, queries, chunksize=chunksize))
+
     def _normalize_query(self, nrql: str) -> str:
         """Normalize NRQL query for parsing."""
         # Remove extra whitespace
@@ -252,105 +414,107 @@ class NRQLtoDQLConverter:
         # Ensure consistent casing for keywords
         return nrql.strip()
 
-    def _parse_nrql(self, nrql: str) -> Dict[str, Any]:
-        """Parse NRQL into components."""
-        parsed = {
-            "select": [],
-            "from": None,
-            "where": None,
-            "facet": None,
-            "since": None,
-            "until": None,
-            "limit": None,
-            "timeseries": None,
-            "compare_with": None,
-            "order_by": None,
-        }
-
-        # Extract SELECT clause
-        select_match = re.search(
-            r"SELECT\s+(.+?)\s+FROM",
-            nrql,
-            re.IGNORECASE
-        )
-        if select_match:
-            parsed["select"] = self._parse_select(select_match.group(1))
-
-        # Extract FROM clause
-        from_match = re.search(
-            r"FROM\s+(\w+)",
-            nrql,
-            re.IGNORECASE
-        )
-        if from_match:
-            parsed["from"] = from_match.group(1)
-
-        # Extract WHERE clause
-        where_match = re.search(
-            r"WHERE\s+(.+?)(?:FACET|SINCE|UNTIL|LIMIT|TIMESERIES|COMPARE|ORDER|$)",
-            nrql,
-            re.IGNORECASE
-        )
-        if where_match:
-            parsed["where"] = where_match.group(1).strip()
-
-        # Extract FACET clause
-        facet_match = re.search(
-            r"FACET\s+(.+?)(?:SINCE|UNTIL|LIMIT|TIMESERIES|COMPARE|ORDER|$)",
-            nrql,
-            re.IGNORECASE
-        )
-        if facet_match:
-            parsed["facet"] = [f.strip() for f in facet_match.group(1).split(",")]
-
-        # Extract SINCE clause
-        since_match = re.search(
-            r"SINCE\s+(.+?)(?:UNTIL|LIMIT|TIMESERIES|COMPARE|ORDER|$)",
-            nrql,
-            re.IGNORECASE
-        )
-        if since_match:
-            parsed["since"] = since_match.group(1).strip()
-
-        # Extract UNTIL clause
-        until_match = re.search(
-            r"UNTIL\s+(.+?)(?:LIMIT|TIMESERIES|COMPARE|ORDER|$)",
-            nrql,
-            re.IGNORECASE
-        )
-        if until_match:
-            parsed["until"] = until_match.group(1).strip()
-
-        # Extract LIMIT clause
-        limit_match = re.search(
-            r"LIMIT\s+(\d+)",
-            nrql,
-            re.IGNORECASE
-        )
-        if limit_match:
-            parsed["limit"] = int(limit_match.group(1))
-
-        # Extract TIMESERIES clause
-        timeseries_match = re.search(
-            r"TIMESERIES(?:\s+(\d+)\s+(\w+))?",
-            nrql,
-            re.IGNORECASE
-        )
-        if timeseries_match:
-            if timeseries_match.group(1):
-                parsed["timeseries"] = f"{timeseries_match.group(1)} {timeseries_match.group(2)}"
+    # Clause keyword lengths for the fast path (leading space included)
+    _FAST_KEYWORD_LEN = {"from": 6, "where": 7, "facet": 7, "since": 7, "limit": 7}
+
+    def _fast_parse_common(self, nrql: str) -> Optional[ParsedNRQL]:
+        """Parse the dominant SELECT/FROM/WHERE/FACET/SINCE/LIMIT shape.
+
+        Clause positions are found with str.find on the uppercased
+        query — no regex engine at all. Returns None for anything
+        outside the common shape (UNTIL, TIMESERIES, COMPARE, ORDER,
+        clauses out of canonical order), handing off to the general
+        tokenizer.
+        """
+        upper = nrql.upper()
+        if not upper.startswith("SELECT "):
+            return None
+        for keyword in (" UNTIL ", " TIMESERIES", " COMPARE ", " ORDER "):
+            if keyword in upper:
+                return None
+
+        i_from = upper.find(" FROM ", 7)
+        if i_from < 0:
+            return None
+
+        positions = [(i_from, "from")]
+        for idx, name in (
+            (upper.find(" WHERE ", i_from), "where"),
+            (upper.find(" FACET ", i_from), "facet"),
+            (upper.find(" SINCE ", i_from), "since"),
+            (upper.find(" LIMIT ", i_from), "limit"),
+        ):
+            if idx >= 0:
+                positions.append((idx, name))
+        if positions != sorted(positions):
+            return None
+
+        parsed = ParsedNRQL()
+        parsed.select = self._parse_select(nrql[7:i_from].strip())
+
+        for k, (start, name) in enumerate(positions):
+            end = positions[k + 1][0] if k + 1 < len(positions) else len(nrql)
+            body = nrql[start + self._FAST_KEYWORD_LEN[name]:end].strip()
+            if name == "from":
+                word_match = _RE_WORD.match(body)
+                if not word_match:
+                    return None
+                parsed.from_ = word_match.group(0)
+            elif name == "where":
+                parsed.where = body
+            elif name == "facet":
+                parsed.facet = [f.strip() for f in body.split(",")]
+            elif name == "since":
+                parsed.since = body
             else:
-                parsed["timeseries"] = "AUTO"
+                if not body.isdigit():
+                    return None
+                parsed.limit = int(body)
 
-        # Extract COMPARE WITH clause
-        compare_match = re.search(
-            r"COMPARE\s+WITH\s+(.+?)(?:LIMIT|ORDER|$)",
-            nrql,
-            re.IGNORECASE
-        )
-        if compare_match:
-            parsed["compare_with"] = compare_match.group(1).strip()
-            self.warnings.append("COMPARE WITH requires manual implementation in DQL")
+        return parsed
+
+    def _parse_nrql(self, nrql: str) -> ParsedNRQL:
+        """Parse NRQL into components."""
+        parsed = ParsedNRQL()
+
+        # Single pass: locate every clause keyword, then slice the text
+        # between adjacent keywords to recover each clause body.
+        matches = list(_RE_CLAUSE_KEYWORDS.finditer(nrql))
+
+        for i, match in enumerate(matches):
+            keyword = " ".join(match.group(1).upper().split())
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(nrql)
+            body = nrql[match.end():end].strip()
+
+            if keyword == "SELECT":
+                parsed.select = self._parse_select(body)
+            elif keyword == "FROM":
+                word_match = _RE_WORD.match(body)
+                if word_match:
+                    parsed.from_ = word_match.group(0)
+            elif keyword == "WHERE":
+                parsed.where = body
+            elif keyword == "FACET":
+                parsed.facet = [f.strip() for f in body.split(",")]
+            elif keyword == "SINCE":
+                parsed.since = body
+            elif keyword == "UNTIL":
+                parsed.until = body
+            elif keyword == "LIMIT":
+                int_match = _RE_INT.match(body)
+                if int_match:
+                    parsed.limit = int(int_match.group(0))
+            elif keyword == "TIMESERIES":
+                args_match = _RE_TIMESERIES_ARGS.match(body)
+                if args_match:
+                    parsed.timeseries = f"{args_match.group(1)} {args_match.group(2)}"
+                else:
+                    parsed.timeseries = "AUTO"
+            elif keyword == "COMPARE WITH":
+                parsed.compare_with = body
+                self.warnings.append("COMPARE WITH requires manual implementation in DQL")
+            elif keyword == "ORDER BY":
+                parsed.order_by = body
 
         return parsed
 
@@ -372,14 +536,17 @@ class NRQLtoDQLConverter:
 
             selection = {"type": "expression", "expression": part}
 
+            # Bare field names can't be aggregations; skip the regex
+            # engine entirely (substring scan is far cheaper than a
+            # match attempt that is doomed to fail).
+            if "(" not in part:
+                selections.append(selection)
+                continue
+
             # Check for aggregation functions
-            agg_match = re.match(
-                r"(\w+)\s*\(\s*(.+?)\s*\)(?:\s+AS\s+['\"]?(\w+)['\"]?)?",
-                part,
-                re.IGNORECASE
-            )
+            agg_match = _RE_AGG.match(part)
             if agg_match:
-                func_name = agg_match.group(1).lower()
+                func_name = agg_match.group(1).casefold()
                 field = agg_match.group(2)
                 alias = agg_match.group(3)
 
@@ -396,51 +563,43 @@ class NRQLtoDQLConverter:
         return selections
 
     def _split_select_parts(self, select_clause: str) -> List[str]:
-        """Split SELECT clause respecting parentheses."""
-        parts = []
-        current = ""
-        depth = 0
-
-        for char in select_clause:
-            if char == "(":
-                depth += 1
-                current += char
-            elif char == ")":
-                depth -= 1
-                current += char
-            elif char == "," and depth == 0:
-                parts.append(current)
-                current = ""
-            else:
-                current += char
+        """Split SELECT clause on top-level commas, respecting parentheses."""
+        if np is not None and select_clause.isascii():
+            # One vectorized pass: cumulative paren depth, then the
+            # positions of commas at depth zero.
+            arr = np.frombuffer(select_clause.encode(), dtype=np.uint8)
+            depth = np.cumsum(
+                (arr == ord("(")).astype(np.int8) - (arr == ord(")")).astype(np.int8)
+            )
+            split_at = np.where((arr == ord(",")) & (depth == 0))[0].tolist()
+        else:
+            split_at = []
+            depth = 0
+            for i, char in enumerate(select_clause):
+                if char == "(":
+                    depth += 1
+                elif char == ")":
+                    depth -= 1
+                elif char == "," and depth == 0:
+                    split_at.append(i)
 
-        if current:
-            parts.append(current)
+        parts = []
+        start = 0
+        for idx in split_at:
+            parts.append(select_clause[start:idx])
+            start = idx + 1
+        tail = select_clause[start:]
+        if tail:
+            parts.append(tail)
 
         return parts
 
-    def _determine_query_type(self, parsed: Dict[str, Any]) -> QueryType:
+    def _determine_query_type(self, parsed: ParsedNRQL) -> QueryType:
         """Determine the type of query based on FROM clause."""
-        from_clause = parsed.get("from", "").lower()
-
-        if from_clause in ["log", "logs"]:
-            return QueryType.LOGS
-        elif from_clause in ["span", "spans", "distributedtrace"]:
-            return QueryType.TRACES
-        elif from_clause in ["metric", "metrics"]:
-            return QueryType.METRICS
-        elif from_clause in self.EVENT_TYPE_MAPPINGS:
-            mapping = self.EVENT_TYPE_MAPPINGS[from_clause]
-            if mapping[0] == "logs":
-                return QueryType.LOGS
-            elif mapping[0] == "spans":
-                return QueryType.TRACES
-            else:
-                return QueryType.METRICS
-        else:
-            return QueryType.EVENTS
+        from_clause = (parsed.from_ or "").casefold()
+        return _FROM_TO_QUERYTYPE.get(from_clause, QueryType.EVENTS)
 
-    def _build_dql(self, parsed: Dict[str, Any], query_type: QueryType) -> str:
+    def _build_dql(self, parsed: ParsedNRQL, query_type: QueryType) -> str:
         """Build DQL query from parsed NRQL."""
         dql_parts = []
 
@@ -449,9 +608,9 @@ class NRQLtoDQLConverter:
         dql_parts.append(fetch_statement)
 
         # Add filter (WHERE)
-        if parsed.get("where"):
-            filter_clause = self._convert_where(parsed["where"])
-            dql_parts.append(f"| filter {filter_clause}")
+        if parsed.where:
+            filter_clause = self._convert_where(parsed.where)
+            dql_parts.append("| filter " + filter_clause)
 
         # Add summarize/fieldsAdd for aggregations
         aggregation_clause = self._build_aggregations(parsed)
@@ -459,140 +618,168 @@ class NRQLtoDQLConverter:
             dql_parts.append(aggregation_clause)
 
         # Add group by (FACET)
-        if parsed.get("facet"):
-            facet_fields = [self._map_field(f) for f in parsed["facet"]]
+        if parsed.facet:
+            facet_fields = [self._map_field(f) for f in parsed.facet]
             # In DQL, grouping is part of summarize
             if "summarize" not in dql_parts[-1]:
                 dql_parts.append(f"| summarize by: {{{', '.join(facet_fields)}}}")
 
         # Add sort (ORDER BY)
-        if parsed.get("order_by"):
-            dql_parts.append(f"| sort {parsed['order_by']}")
+        if parsed.order_by:
+            dql_parts.append("| sort " + parsed.order_by)
 
         # Add limit
-        if parsed.get("limit"):
-            dql_parts.append(f"| limit {parsed['limit']}")
+        if parsed.limit:
+            dql_parts.append(f"| limit {parsed.limit}")
 
         return "\n".join(dql_parts)
 
-    def _build_fetch(self, parsed: Dict[str, Any], query_type: QueryType) -> str:
+    def _build_fetch(self, parsed: ParsedNRQL, query_type: QueryType) -> str:
         """Build the fetch statement."""
-        from_clause = parsed.get("from", "")
+        from_clause = parsed.from_ or ""
 
         # Get time range
         time_range = self._convert_time_range(parsed)
 
         # Determine data source
         if query_type == QueryType.LOGS:
-            fetch = f"fetch logs{time_range}"
+            fetch = "fetch logs" + time_range
         elif query_type == QueryType.TRACES:
-            fetch = f"fetch spans{time_range}"
+            fetch = "fetch spans" + time_range
         elif query_type == QueryType.METRICS:
             # Check if we have a specific metric mapping
             if from_clause in self.EVENT_TYPE_MAPPINGS:
                 mapping = self.EVENT_TYPE_MAPPINGS[from_clause]
                 if mapping[1]:
-                    fetch = f"timeseries {mapping[1]}{time_range}"
+                    fetch = "timeseries " + mapping[1] + time_range
                 else:
-                    fetch = f"fetch dt.entity.service{time_range}"
+                    fetch = "fetch dt.entity.service" + time_range
             else:
-                fetch = f"fetch dt.entity.service{time_range}"
+                fetch = "fetch dt.entity.service" + time_range
         else:
             # Business events or custom
-            fetch = f"fetch bizevents{time_range}"
+            fetch = "fetch bizevents" + time_range
             self.warnings.append(f"Event type '{from_clause}' mapped to bizevents - verify this is correct")
 
         return fetch
 
-    def _convert_time_range(self, parsed: Dict[str, Any]) -> str:
+    def _convert_time_range(self, parsed: ParsedNRQL) -> str:
         """Convert NRQL time range to DQL."""
-        since = parsed.get("since", "")
+        since = parsed.since or ""
 
         if not since:
             return ""
 
-        since_lower = since.lower()
-
-        # Convert common patterns
-        time_mappings = {
-            "1 hour ago": ", from:now()-1h",
-            "1 hours ago": ", from:now()-1h",
-            "2 hours ago": ", from:now()-2h",
-            "3 hours ago": ", from:now()-3h",
-            "6 hours ago": ", from:now()-6h",
-            "12 hours ago": ", from:now()-12h",
-            "24 hours ago": ", from:now()-24h",
-            "1 day ago": ", from:now()-1d",
-            "2 days ago": ", from:now()-2d",
-            "7 days ago": ", from:now()-7d",
-            "1 week ago": ", from:now()-7d",
-            "30 days ago": ", from:now()-30d",
-            "1 month ago": ", from:now()-30d",
-        }
-
-        for nrql_time, dql_time in time_mappings.items():
-            if nrql_time in since_lower:
-                return dql_time
-
-        # Try to parse numeric patterns
-        time_match = re.match(r"(\d+)\s+(minute|hour|day|week|month)s?\s+ago", since_lower)
+        # A single relative-time pattern plus unit arithmetic covers
+        # everything the old hard-coded lookup table enumerated.
+        time_match = _RE_RELATIVE_TIME.search(since.casefold())
         if time_match:
-            value = time_match.group(1)
-            unit = time_match.group(2)[0]  # First letter: m, h, d, w, m
-            if unit == "w":
-                value = str(int(value) * 7)
-                unit = "d"
-            elif unit == "m" and time_match.group(2) == "month":
-                value = str(int(value) * 30)
-                unit = "d"
-            return f", from:now()-{value}{unit}"
+            unit = time_match.group(2)
+            value = int(time_match.group(1)) * _TIME_UNIT_MULTIPLIER.get(unit, 1)
+            return f", from:now()-{value}{_TIME_UNIT_SUFFIX[unit]}"
 
         self.warnings.append(f"Could not convert time range: {since}")
         return ""
 
     def _convert_where(self, where_clause: str) -> str:
-        """Convert NRQL WHERE clause to DQL filter."""
-        result = where_clause
-
-        # Map fields
-        for nrql_field, dql_field in self.FIELD_MAPPINGS.items():
-            pattern = rf"\b{re.escape(nrql_field)}\b"
-            if re.search(pattern, result, re.IGNORECASE):
-                result = re.sub(pattern, dql_field, result, flags=re.IGNORECASE)
-                self.field_mappings_used[nrql_field] = dql_field
-
-        # Convert operators
-        result = re.sub(r"\s*=\s*", " == ", result)
-        result = re.sub(r"\bAND\b", "and", result, flags=re.IGNORECASE)
-        result = re.sub(r"\bOR\b", "or", result, flags=re.IGNORECASE)
-        result = re.sub(r"\bNOT\b", "not", result, flags=re.IGNORECASE)
-
-        # Convert LIKE to matches (basic conversion)
-        like_pattern = r"(\w+(?:\.\w+)*)\s+LIKE\s+'([^']+)'"
-        like_matches = re.findall(like_pattern, result, re.IGNORECASE)
-        for field, pattern in like_matches:
-            # Convert SQL wildcards to regex
-            regex_pattern = pattern.replace("%", ".*").replace("_", ".")
-            result = re.sub(
-                rf"{re.escape(field)}\s+LIKE\s+'{re.escape(pattern)}'",
-                f'matchesPhrase({field}, "{regex_pattern}")',
-                result,
-                flags=re.IGNORECASE
-            )
+        """Convert NRQL WHERE clause to DQL filter.
 
-        # Convert IN clause
-        in_pattern = r"(\w+(?:\.\w+)*)\s+IN\s*\(([^)]+)\)"
-        result = re.sub(in_pattern, r"in(\1, \2)", result, flags=re.IGNORECASE)
+        All rewrites are collected as (start, end, replacement) edits
+        against the original clause and applied with one final join,
+        so the conversion allocates a single output string no matter
+        how many rules fire.
+        """
+        text = where_clause
+        edits: List[Tuple[int, int, str]] = []
+
+        for match in _RE_WHERE_REWRITE.finditer(text):
+            edits.append((match.start(), match.end(), self._rewrite_term(match)))
 
-        # Convert IS NULL / IS NOT NULL
-        result = re.sub(r"(\w+)\s+IS\s+NULL", r"isNull(\1)", result, flags=re.IGNORECASE)
-        result = re.sub(r"(\w+)\s+IS\s+NOT\s+NULL", r"isNotNull(\1)", result, flags=re.IGNORECASE)
+        # Field renames fill the regions the construct rewrites didn't
+        # claim (those map their captured fields themselves).
+        taken = [(start, stop) for start, stop, _ in edits]
+        for start, stop, nrql_field, dql_field in self._field_matches(text):
+            if any(s < stop and start < e for s, e in taken):
+                continue
+            self.field_mappings_used[nrql_field] = dql_field
+            edits.append((start, stop, dql_field))
 
-        return result.strip()
+        if not edits:
+            return text.strip()
 
-    def _build_aggregations(self, parsed: Dict[str, Any]) -> str:
+        edits.sort()
+        parts = []
+        cursor = 0
+        for start, stop, replacement in edits:
+            parts.append(text[cursor:start])
+            parts.append(replacement)
+            cursor = stop
+        parts.append(text[cursor:])
+        return "".join(parts).strip()
+
+    def _rewrite_term(self, match: "re.Match") -> str:
+        """Dispatch one fused-rewrite match to its DQL replacement."""
+        if match.group("eq") is not None:
+            return " == "
+        if match.group("and") is not None:
+            return "and"
+        if match.group("or") is not None:
+            return "or"
+        if match.group("like") is not None:
+            pattern = match.group("like_pattern").replace("%", ".*").replace("_", ".")
+            return f'matchesPhrase({self._map_field(match.group("like_field"))}, "{pattern}")'
+        if match.group("in") is not None:
+            values = _FIELD_RE.sub(
+                lambda m: self._map_field(m.group(1)), match.group("in_values")
+            )
+            return f'in({self._map_field(match.group("in_field"))}, {values})'
+        if match.group("isnotnull") is not None:
+            return f'isNotNull({self._map_field(match.group("nn_field"))})'
+        if match.group("isnull") is not None:
+            return f'isNull({self._map_field(match.group("null_field"))})'
+        return "not"
+
+    def _field_matches(self, text: str) -> List[Tuple[int, int, str, str]]:
+        """Find mapped field occurrences as (start, end, nrql, dql) spans.
+
+        Uses the Aho-Corasick automaton when available (word boundaries
+        verified against the original text, leftmost-longest kept to
+        mirror the regex alternation semantics), else the precompiled
+        alternation.
+        """
+        if _FIELD_AUTOMATON is None:
+            return [
+                (match.start(), match.end(), *_FIELD_MAP_CI[match.group(1).casefold()])
+                for match in _FIELD_RE.finditer(text)
+            ]
+
+        # .lower(), not .casefold(): the automaton match offsets index
+        # back into the original text, so the normalized copy must keep
+        # its length.
+        lowered = text.lower()
+        candidates = []
+        for end_idx, (nrql_field, dql_field) in _FIELD_AUTOMATON.iter(lowered):
+            start = end_idx - len(nrql_field) + 1
+            if start > 0 and (text[start - 1].isalnum() or text[start - 1] == "_"):
+                continue
+            stop = end_idx + 1
+            if stop < len(text) and (text[stop].isalnum() or text[stop] == "_"):
+                continue
+            candidates.append((start, stop, nrql_field, dql_field))
+
+        candidates.sort(key=lambda c: (c[0], c[0] - c[1]))
+        matches = []
+        cursor = 0
+        for start, stop, nrql_field, dql_field in candidates:
+            if start < cursor:
+                continue
+            matches.append((start, stop, nrql_field, dql_field))
+            cursor = stop
+        return matches
+
+    def _build_aggregations(self, parsed: ParsedNRQL) -> str:
         """Build aggregation statements from SELECT."""
-        selections = parsed.get("select", [])
+        selections = parsed.select
 
         if not selections:
             return ""
@@ -614,7 +801,7 @@ class NRQLtoDQLConverter:
             mapped_field = self._map_field(field)
 
             # Map function
-            dql_func = self.AGGREGATION_MAPPINGS.get(func.lower())
+            dql_func = self.AGGREGATION_MAPPINGS.get(func.casefold())
 
             if dql_func is None:
                 self.manual_review.append(f"Aggregation '{func}' needs manual conversion")
@@ -622,9 +809,9 @@ class NRQLtoDQLConverter:
 
             if dql_func == "count()":
                 agg_expr = "count()"
-            elif func.lower() == "percentile":
+            elif func.casefold() == "percentile":
                 # Handle percentile(field, 95) syntax
-                percentile_match = re.match(r"(.+?),\s*(\d+)", field)
+                percentile_match = _RE_PERCENTILE_ARGS.match(field)
                 if percentile_match:
                     pct_field = self._map_field(percentile_match.group(1))
                     pct_value = percentile_match.group(2)
@@ -639,29 +826,23 @@ class NRQLtoDQLConverter:
 
             agg_parts.append(agg_expr)
 
-        # Add facet grouping if present
-        facet = parsed.get("facet")
-        if facet:
-            facet_fields = [self._map_field(f) for f in facet]
-            return f"| summarize {', '.join(agg_parts)}, by: {{{', '.join(facet_fields)}}}"
-        else:
-            return f"| summarize {', '.join(agg_parts)}"
+        # Add facet grouping if present; assemble with one join instead
+        # of layered f-strings re-copying the aggregate list.
+        buf = ["| summarize ", ", ".join(agg_parts)]
+        if parsed.facet:
+            buf.append(", by: {")
+            buf.append(", ".join(self._map_field(f) for f in parsed.facet))
+            buf.append("}")
+        return "".join(buf)
 
     def _map_field(self, field: str) -> str:
         """Map a field name from NRQL to DQL."""
         field = field.strip()
 
-        # Check direct mapping
-        if field in self.FIELD_MAPPINGS:
-            self.field_mappings_used[field] = self.FIELD_MAPPINGS[field]
-            return self.FIELD_MAPPINGS[field]
-
-        # Check case-insensitive
-        field_lower = field.lower()
-        for nrql_field, dql_field in self.FIELD_MAPPINGS.items():
-            if nrql_field.lower() == field_lower:
-                self.field_mappings_used[field] = dql_field
-                return dql_field
+        hit = _FIELD_MAP_CI.get(field.casefold())
+        if hit is not None:
+            self.field_mappings_used[field] = hit[1]
+            return hit[1]
 
         # No mapping found, return as-is
         return field
@@ -678,11 +859,103 @@ class NRQLtoDQLConverter:
             return "high"
 
 
+# Intern the static mapping strings so hot-path equality checks and
+# dict probes compare shared singletons instead of rehashing copies.
+NRQLtoDQLConverter.FIELD_MAPPINGS = {
+    sys.intern(k): sys.intern(v)
+    for k, v in NRQLtoDQLConverter.FIELD_MAPPINGS.items()
+}
+NRQLtoDQLConverter.EVENT_TYPE_MAPPINGS = {
+    sys.intern(k): (sys.intern(v[0]), sys.intern(v[1]) if v[1] else v[1])
+    for k, v in NRQLtoDQLConverter.EVENT_TYPE_MAPPINGS.items()
+}
+NRQLtoDQLConverter.AGGREGATION_MAPPINGS = {
+    sys.intern(k): (sys.intern(v) if v is not None else None)
+    for k, v in NRQLtoDQLConverter.AGGREGATION_MAPPINGS.items()
+}
+NRQLtoDQLConverter.OPERATOR_MAPPINGS = {
+    sys.intern(k): sys.intern(v)
+    for k, v in NRQLtoDQLConverter.OPERATOR_MAPPINGS.items()
+}
+
+# Below this many queries the pool startup and pickling overhead of
+# process fan-out outweighs the parallel speedup.
+_PARALLEL_THRESHOLD = 200
+
+_WORKER_CONVERTER: Optional[NRQLtoDQLConverter] = None
+
+
+def _convert_one(nrql: str) -> ConversionResult:
+    """Convert a single query (executes in a worker process)."""
+    global _WORKER_CONVERTER
+    if _WORKER_CONVERTER is None:
+        _WORKER_CONVERTER = NRQLtoDQLConverter()
+    return _WORKER_CONVERTER.convert(nrql)
+
+
+# Flat FROM-clause -> QueryType table so _determine_query_type is one
+# dict probe. The EVENT_TYPE_MAPPINGS entries keep their original
+# casing, matching the membership check they replace.
+_FROM_TO_QUERYTYPE = {
+    "log": QueryType.LOGS,
+    "logs": QueryType.LOGS,
+    "span": QueryType.TRACES,
+    "spans": QueryType.TRACES,
+    "distributedtrace": QueryType.TRACES,
+    "metric": QueryType.METRICS,
+    "metrics": QueryType.METRICS,
+}
+for _event, _mapping in NRQLtoDQLConverter.EVENT_TYPE_MAPPINGS.items():
+    if _mapping[0] == "logs":
+        _FROM_TO_QUERYTYPE.setdefault(_event, QueryType.LOGS)
+    elif _mapping[0] == "spans":
+        _FROM_TO_QUERYTYPE.setdefault(_event, QueryType.TRACES)
+    else:
+        _FROM_TO_QUERYTYPE.setdefault(_event, QueryType.METRICS)
+
+# Field substitution artifacts, built once from the class-level table.
+# Longest-first ordering makes the alternation prefer "error.class" over
+# "error" at the same position; the CI map keeps the canonical NRQL key
+# so field_mappings_used reporting is unchanged.
+_FIELD_MAP_CI = {
+    k.casefold(): (k, v) for k, v in NRQLtoDQLConverter.FIELD_MAPPINGS.items()
+}
+_FIELD_RE = _compile(
+    r"\b("
+    + "|".join(
+        sorted(
+            (re.escape(k) for k in NRQLtoDQLConverter.FIELD_MAPPINGS),
+            key=len,
+            reverse=True,
+        )
+    )
+    + r")\b",
+    re.IGNORECASE
+)
+
+
+def _build_field_automaton() -> Optional["ahocorasick.Automaton"]:
+    """Build the Aho-Corasick automaton over the field-mapping keys."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for nrql_field, dql_field in NRQLtoDQLConverter.FIELD_MAPPINGS.items():
+        automaton.add_word(nrql_field.lower(), (nrql_field, dql_field))
+    automaton.make_automaton()
+    return automaton
+
+
+_FIELD_AUTOMATON = _build_field_automaton()
+
+
 # =============================================================================
 # Reference Tables
 # =============================================================================
 
-NRQL_DQL_REFERENCE = """
+@functools.cache
+def _reference_text() -> str:
+    """The plain-text NRQL to DQL quick reference, rendered on demand."""
+    return """
 ┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
 ┃                        NRQL to DQL Quick Reference                                  ┃
 ┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫
@@ -714,8 +987,11 @@ NRQL_DQL_REFERENCE = """
 """
 
 
-def print_reference_table():
-    """Print the NRQL to DQL reference table."""
+@functools.cache
+def _reference_table() -> "Table":
+    """Build the rich reference table once per process."""
+    from rich.table import Table
+
     table = Table(title="NRQL to DQL Quick Reference", show_header=True, header_style="bold cyan")
     table.add_column("NRQL", style="green")
     table.add_column("DQL", style="blue")
@@ -746,11 +1022,21 @@ def print_reference_table():
     for nrql, dql in references:
         table.add_row(nrql, dql)
 
-    console.print(table)
+    return table
+
+
+def print_reference_table():
+    """Print the NRQL to DQL reference table."""
+    _console().print(_reference_table())
 
 
 def display_result(result: ConversionResult):
     """Display conversion result with rich formatting."""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
+    console = _console()
+
     # Original NRQL
     console.print("\n[bold cyan]Original NRQL:[/bold cyan]")
     console.print(Panel(result.original_nrql, border_style="cyan"))
@@ -806,6 +1092,7 @@ def main(query: Optional[str], interactive: bool, file: Optional[str], reference
 
         python nrql_to_dql.py --reference
     """
+    console = _console()
     converter = NRQLtoDQLConverter()
 
     if reference:
@@ -844,18 +1131,19 @@ def main(query: Optional[str], interactive: bool, file: Optional[str], reference
         with open(file, "r") as f:
             queries = [line.strip() for line in f if line.strip() and not line.startswith("#")]
 
-        results = []
-        for q in queries:
-            result = converter.convert(q)
-            results.append(result)
+        results = converter.convert_many(queries)
+        for result in results:
             display_result(result)
             console.print("─" * 60)
 
         if output:
-            with open(output, "w") as f:
-                for result in results:
-                    f.write(f"-- Original: {result.original_nrql}\n")
-                    f.write(f"{result.converted_dql}\n\n")
+            # One writelines call on a large buffer instead of two
+            # buffered writes per result
+            with open(output, "w", buffering=1 << 16) as f:
+                f.writelines(
+                    f"-- Original: {result.original_nrql}\n{result.converted_dql}\n\n"
+                    for result in results
+                )
             console.print(f"[green]Results saved to {output}[/green]")
 
         return